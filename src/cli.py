@@ -8,15 +8,29 @@ Supports two modes:
 from __future__ import annotations
 
 import argparse
+import functools
+import itertools
 import json
 import sys
 
-from ecds_shock_index import ShockIndexCalculator, classify_risk
-from ecds_shock_index.data_loader import load_cms_measure_weights, load_ncqa_ecds, merge_ecds_and_weights
+from ecds_shock_index import ContractAccumulator, ShockIndexCalculator, classify_risk
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be a positive integer."""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer (got {value})")
+    return number
+
+
+@functools.lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
-    """Create argument parser for CLI execution."""
+    """Create argument parser for CLI execution.
+
+    The parser schema is static, so it is built once and reused; callers
+    must not add arguments to the returned parser.
+    """
     parser = argparse.ArgumentParser(
         prog="ecds-shock-index",
         description="Compute ECDS Shock Index from normalized factors or a CSV file.",
@@ -33,14 +47,17 @@ def build_parser() -> argparse.ArgumentParser:
 
     # -- batch mode --
     batch = sub.add_parser("batch", help="Score all measures from CSV files.")
-    batch.add_argument("--ecds", required=True, help="Path to NCQA ECDS results CSV")
-    batch.add_argument("--weights", required=True, help="Path to CMS measure weights CSV")
+    batch.add_argument("--ecds", required=True, help="Path to NCQA ECDS results CSV or Parquet file")
+    batch.add_argument("--weights", required=True, help="Path to CMS measure weights CSV or Parquet file")
     batch.add_argument("--guardrail", type=float, default=0.05, help="CMS cut-point guardrail cap for CPR (default: 0.05 = +/-5%%)")
     batch.add_argument("--max-shift", type=float, default=0.5, help="Max cutpoint shift for the latent CPR term (default: 0.5)")
     batch.add_argument("--max-weight", type=float, default=5.0, help="Max measure weight for WM normalization (default: 5.0)")
     batch.add_argument("--sensitivity", type=float, default=1.0, help="EAV deviation sensitivity (default: 1.0)")
     batch.add_argument("--output", "-o", help="Write scored CSV to this path (default: print to stdout)")
     batch.add_argument("--json", action="store_true", dest="as_json", help="Output contract-level summary as JSON")
+    batch.add_argument("--cache", action="store_true", help="Reuse Parquet copies of CSV inputs across runs (requires pyarrow)")
+    batch.add_argument("--float32", action="store_true", help="Score in single precision to halve memory traffic on large inputs")
+    batch.add_argument("--chunk-size", type=_positive_int, help="Stream the ECDS file in chunks of this many rows, writing scored rows as CSV")
 
     # -- legacy: support the old flat --ccs/--eav/--cpr/--wm style --
     parser.add_argument("--ccs", type=float, help=argparse.SUPPRESS)
@@ -61,19 +78,49 @@ def _run_single(ccs: float, eav: float, cpr: float, wm: float, as_json: bool = F
         print(f"ECDS Shock Index: {score:.4f}  ({tier} risk)")
 
 
-def _run_batch(args: argparse.Namespace) -> None:
-    ecds_df = load_ncqa_ecds(args.ecds)
-    weights_df = load_cms_measure_weights(args.weights)
-    merged = merge_ecds_and_weights(ecds_df, weights_df)
+def _print_summary(summary: dict, as_json: bool) -> None:
+    print()
+    if as_json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print("Contract Summary")
+        print(f"  Weighted Shock Index: {summary['weighted_shock_index']:.4f}")
+        print(f"  Mean Shock Index:     {summary['mean_shock_index']:.4f}")
+        print(f"  Max Shock Index:      {summary['max_shock_index']:.4f}")
+        print(f"  Measure Count:        {summary['measure_count']}")
+        print(f"  Risk Tier:            {summary['risk_tier']}")
 
-    calc = ShockIndexCalculator()
-    scored = calc.score_dataframe(
-        merged,
+
+def _batch_calculator(args: argparse.Namespace) -> ShockIndexCalculator:
+    """Build a calculator carrying the batch factor parameters from *args*."""
+    return ShockIndexCalculator(
         guardrail=args.guardrail,
         max_shift=args.max_shift,
         max_weight=args.max_weight,
         sensitivity=args.sensitivity,
     )
+
+
+def _run_batch(args: argparse.Namespace) -> None:
+    if args.chunk_size is not None:
+        _run_batch_streaming(args)
+        return
+
+    # Imported here so single mode does not pay for loading pandas.
+    from ecds_shock_index.data_loader import (
+        default_cache_dir,
+        load_cms_measure_weights,
+        load_ncqa_ecds,
+        merge_ecds_and_weights,
+    )
+
+    cache_dir = default_cache_dir() if args.cache else None
+    ecds_df = load_ncqa_ecds(args.ecds, cache_dir=cache_dir)
+    weights_df = load_cms_measure_weights(args.weights, cache_dir=cache_dir)
+    merged = merge_ecds_and_weights(ecds_df, weights_df)
+
+    calc = _batch_calculator(args)
+    scored = calc.score_dataframe(merged, dtype="float32" if args.float32 else "float64")
     summary = calc.aggregate_contract(scored)
 
     if args.output:
@@ -82,16 +129,49 @@ def _run_batch(args: argparse.Namespace) -> None:
     else:
         print(scored.to_string(index=False))
 
-    print()
-    if args.as_json:
-        print(json.dumps(summary, indent=2))
-    else:
-        print("Contract Summary")
-        print(f"  Weighted Shock Index: {summary['weighted_shock_index']:.4f}")
-        print(f"  Mean Shock Index:     {summary['mean_shock_index']:.4f}")
-        print(f"  Max Shock Index:      {summary['max_shock_index']:.4f}")
-        print(f"  Measure Count:        {summary['measure_count']}")
-        print(f"  Risk Tier:            {summary['risk_tier']}")
+    _print_summary(summary, args.as_json)
+
+
+def _run_batch_streaming(args: argparse.Namespace) -> None:
+    """Score the ECDS file chunk by chunk, keeping only running totals in memory.
+
+    Scored rows are appended to ``--output`` (or written to stdout) as CSV.
+    """
+    from ecds_shock_index.data_loader import (
+        default_cache_dir,
+        iter_ncqa_ecds,
+        load_cms_measure_weights,
+        merge_ecds_and_weights,
+    )
+
+    cache_dir = default_cache_dir() if args.cache else None
+    weights_df = load_cms_measure_weights(args.weights, cache_dir=cache_dir)
+
+    calc = _batch_calculator(args)
+    totals = ContractAccumulator()
+    scored_chunks = (
+        calc.score_dataframe(
+            merge_ecds_and_weights(chunk, weights_df),
+            dtype="float32" if args.float32 else "float64",
+        )
+        for chunk in iter_ncqa_ecds(args.ecds, args.chunk_size)
+    )
+    # Score the first chunk before opening --output, so a bad input file
+    # fails without truncating an existing output.
+    first = next(scored_chunks, None)
+    out = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        if first is not None:
+            for i, scored in enumerate(itertools.chain([first], scored_chunks)):
+                scored.to_csv(out, index=False, header=(i == 0))
+                totals.update(scored)
+    finally:
+        if args.output:
+            out.close()
+
+    if args.output:
+        print(f"Scored CSV written to {args.output}")
+    _print_summary(totals.summary(), args.as_json)
 
 
 def main() -> None:
@@ -6,10 +6,22 @@ that combines factor values using a weighted average.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+import math
+from bisect import bisect_right
+from dataclasses import FrozenInstanceError, dataclass, fields
+from functools import lru_cache
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
+import numpy as np
+import numpy.typing as npt
+
+from ecds_shock_index import _kernels
+
+if TYPE_CHECKING:
+    # pandas is only needed by the DataFrame methods; importing it lazily
+    # keeps scalar use (e.g. ``ecds-shock-index single``) fast to start.
+    import pandas as pd
 
 
 # ---------------------------------------------------------------------------
@@ -23,10 +35,65 @@ RISK_TIERS: dict[str, tuple[float, float]] = {
     "critical": (0.75, 1.01),
 }
 
+# Sorted inner tier edges and matching labels, derived once from RISK_TIERS.
+# A score's tier is the label at ``bisect_right(_TIER_EDGES, score)``; the
+# NumPy copies serve the vectorized ``np.searchsorted`` path.
+_TIER_EDGES = tuple(lo for lo, _ in RISK_TIERS.values())[1:]
+_TIER_LABELS = tuple(RISK_TIERS)
+_TIER_BOUNDS = np.array(_TIER_EDGES)
+_TIER_LABEL_ARRAY = np.array(_TIER_LABELS)
+
 
 def _clip_01(value: float) -> float:
-    """Clamp a numeric value to the inclusive range [0, 1]."""
-    return max(0.0, min(1.0, value))
+    """Clamp a numeric value to the inclusive range [0, 1].
+
+    Plain float comparisons avoid two generic ``min``/``max`` builtin calls.
+    NaN fails every comparison and clamps to 1.0, as it did under
+    ``max(0.0, min(1.0, value))``.
+    """
+    if 0.0 <= value <= 1.0:
+        return value
+    return 0.0 if value < 0.0 else 1.0
+
+
+def _clip_01_array(values: np.ndarray) -> np.ndarray:
+    """Clamp an array to [0, 1] with the same NaN handling as ``_clip_01``.
+
+    ``np.fmin``/``np.fmax`` ignore NaN operands, so a NaN input clamps to 1.0
+    exactly as the scalar ``_clip_01`` does.
+    """
+    return np.fmax(0.0, np.fmin(1.0, values))
+
+
+def _cap_1(value: float) -> float:
+    """Upper-clamp a non-negative (or NaN) value to 1.0.
+
+    EAV and CPR are built from absolute values and can never go below 0, so
+    they skip the lower bound. NaN fails the comparison and maps to 1.0, as
+    in ``_clip_01``.
+    """
+    return value if value < 1.0 else 1.0
+
+
+def _require_positive(name: str, value: float) -> None:
+    """Raise ``ValueError`` unless *value* is strictly positive."""
+    if value <= 0:
+        raise ValueError(f"{name} must be greater than zero")
+
+
+# Inputs of these types take the scalar path in the factor helpers. The
+# isinstance check is far cheaper than ``np.isscalar``/``np.ndim`` on the
+# per-row path. ``np.number`` covers the NumPy scalars (np.int64,
+# np.float32, ...) that row loops over ``.to_numpy()`` produce.
+_SCALAR_TYPES = (float, int, np.number)
+
+
+def _as_float_array(values: npt.ArrayLike) -> np.ndarray:
+    """Return *values* as a floating-point array, keeping float32 as-is."""
+    array = np.asarray(values)
+    if array.dtype.kind != "f":
+        array = array.astype(np.float64)
+    return array
 
 
 # ---------------------------------------------------------------------------
@@ -42,7 +109,10 @@ def _clip_01(value: float) -> float:
 _CPR_LATENT_SHARE = 0.20
 
 
-def ccs_score(completeness_rate: float, mapping_coverage: float) -> float:
+def ccs_score(
+    completeness_rate: float | npt.ArrayLike,
+    mapping_coverage: float | npt.ArrayLike,
+) -> float | np.ndarray:
     """Compute the Clinical Completeness *Gap* Score (CCS).
 
     CCS is a **risk** component: it is the gap between perfect capture and the
@@ -55,11 +125,20 @@ def ccs_score(completeness_rate: float, mapping_coverage: float) -> float:
     scores 1.0. This direction reflects NCQA ECDS guidance that incomplete /
     poorly-mapped capture is the dominant driver of transition risk. (Earlier
     versions returned raw completeness, which inverted the risk direction.)
+
+    Array-like inputs (NumPy arrays, pandas Series, lists) are scored
+    elementwise and return an ndarray; this holds for every factor helper.
     """
-    return _clip_01(1.0 - (completeness_rate + mapping_coverage) / 2.0)
+    if isinstance(completeness_rate, _SCALAR_TYPES) and isinstance(mapping_coverage, _SCALAR_TYPES):
+        return _clip_01(1.0 - (completeness_rate + mapping_coverage) / 2.0)
+    return _ccs_array(_as_float_array(completeness_rate), _as_float_array(mapping_coverage))
 
 
-def eav_score(variance_ratio: float, baseline: float = 1.0, sensitivity: float = 1.0) -> float:
+def eav_score(
+    variance_ratio: float | npt.ArrayLike,
+    baseline: float = 1.0,
+    sensitivity: float = 1.0,
+) -> float | np.ndarray:
     """Compute the ECDS Adoption Variability (EAV) score.
 
     Risk grows with the *deviation* of the variance ratio from baseline in
@@ -72,14 +151,18 @@ def eav_score(variance_ratio: float, baseline: float = 1.0, sensitivity: float =
     1.0, a ratio twice (or zero times) the baseline maps to 1.0. (Earlier
     versions mapped the stable case to 0.5, over-stating baseline risk.)
     """
-    if baseline <= 0:
-        raise ValueError("baseline must be greater than zero")
-    if sensitivity <= 0:
-        raise ValueError("sensitivity must be greater than zero")
-    return _clip_01(abs((variance_ratio / baseline) - 1.0) / sensitivity)
-
-
-def cpr_score(cutpoint_shift: float, guardrail: float = 0.05, max_shift: float = 0.5) -> float:
+    _require_positive("baseline", baseline)
+    _require_positive("sensitivity", sensitivity)
+    if isinstance(variance_ratio, _SCALAR_TYPES):
+        return _cap_1(abs((variance_ratio / baseline) - 1.0) / sensitivity)
+    return _eav_array(_as_float_array(variance_ratio), baseline, sensitivity)
+
+
+def cpr_score(
+    cutpoint_shift: float | npt.ArrayLike,
+    guardrail: float = 0.05,
+    max_shift: float = 0.5,
+) -> float | np.ndarray:
     """Compute the guardrail-aware Cutpoint Pressure Risk (CPR) score.
 
     CMS caps year-over-year cut-point movement with a guardrail (±5% for
@@ -94,17 +177,17 @@ def cpr_score(cutpoint_shift: float, guardrail: float = 0.05, max_shift: float =
     excess contributes the (smaller) latent share, representing pressure that
     re-surfaces in later Star years once the guardrail relaxes.
     """
-    if guardrail <= 0:
-        raise ValueError("guardrail must be greater than zero")
-    if max_shift <= 0:
-        raise ValueError("max_shift must be greater than zero")
+    _require_positive("guardrail", guardrail)
+    _require_positive("max_shift", max_shift)
+    if not isinstance(cutpoint_shift, _SCALAR_TYPES):
+        return _cpr_array(_as_float_array(cutpoint_shift), guardrail, max_shift)
     shift = abs(cutpoint_shift)
     realized = min(shift, guardrail) / guardrail
     latent = max(shift - guardrail, 0.0) / max_shift
-    return _clip_01((1.0 - _CPR_LATENT_SHARE) * realized + _CPR_LATENT_SHARE * latent)
+    return _cap_1((1.0 - _CPR_LATENT_SHARE) * realized + _CPR_LATENT_SHARE * latent)
 
 
-def wm_score(measure_weight: float, max_weight: float = 5.0) -> float:
+def wm_score(measure_weight: float | npt.ArrayLike, max_weight: float = 5.0) -> float | np.ndarray:
     """Compute the Weight Multiplier (WM) score from a CMS Stars measure weight.
 
     CMS measure weights are categorical: process measures = 1, intermediate /
@@ -113,9 +196,43 @@ def wm_score(measure_weight: float, max_weight: float = 5.0) -> float:
     is the weight normalized by ``max_weight`` (default 5.0, the improvement
     weight), so higher-weighted measures amplify the composite more strongly.
     """
-    if max_weight <= 0:
-        raise ValueError("max_weight must be greater than zero")
-    return _clip_01(measure_weight / max_weight)
+    _require_positive("max_weight", max_weight)
+    if isinstance(measure_weight, _SCALAR_TYPES):
+        return _clip_01(measure_weight / max_weight)
+    return _wm_array(_as_float_array(measure_weight), max_weight)
+
+
+# ---------------------------------------------------------------------------
+# Vectorized factor kernels (parameters are validated by the caller)
+# ---------------------------------------------------------------------------
+
+
+def _ccs_array(completeness_rate: np.ndarray, mapping_coverage: np.ndarray) -> np.ndarray:
+    """Array form of :func:`ccs_score`."""
+    return _clip_01_array(1.0 - (completeness_rate + mapping_coverage) * 0.5)
+
+
+# The remaining kernels divide every element by the same parameter; they take
+# its reciprocal once and multiply, which vectorizes better than division.
+
+
+def _eav_array(variance_ratio: np.ndarray, baseline: float, sensitivity: float) -> np.ndarray:
+    """Array form of :func:`eav_score`."""
+    # Non-negative by construction, so only the upper bound is applied.
+    return np.fmin(1.0, np.abs(variance_ratio * (1.0 / baseline) - 1.0) * (1.0 / sensitivity))
+
+
+def _cpr_array(cutpoint_shift: np.ndarray, guardrail: float, max_shift: float) -> np.ndarray:
+    """Array form of :func:`cpr_score`."""
+    shift = np.abs(cutpoint_shift)
+    realized = np.minimum(shift, guardrail) * (1.0 / guardrail)
+    latent = np.maximum(shift - guardrail, 0.0) * (1.0 / max_shift)
+    return np.fmin(1.0, (1.0 - _CPR_LATENT_SHARE) * realized + _CPR_LATENT_SHARE * latent)
+
+
+def _wm_array(measure_weight: np.ndarray, max_weight: float) -> np.ndarray:
+    """Array form of :func:`wm_score`."""
+    return _clip_01_array(measure_weight * (1.0 / max_weight))
 
 
 # ---------------------------------------------------------------------------
@@ -123,7 +240,7 @@ def wm_score(measure_weight: float, max_weight: float = 5.0) -> float:
 # ---------------------------------------------------------------------------
 
 
-def classify_risk(score: float) -> str:
+def classify_risk(score: float | npt.ArrayLike) -> str | np.ndarray:
     """Return a risk tier label for a shock index score.
 
     Tiers:
@@ -131,12 +248,78 @@ def classify_risk(score: float) -> str:
         moderate [0.25, 0.50)
         high     [0.50, 0.75)
         critical [0.75, 1.00]
+
+    An array-like of scores returns an ndarray of labels, found with one
+    ``np.searchsorted`` over the tier edges.
+    """
+    if isinstance(score, _SCALAR_TYPES):
+        return _TIER_LABELS[bisect_right(_TIER_EDGES, _clip_01(score))]
+    return _TIER_LABEL_ARRAY[_risk_tier_codes(_as_float_array(score))]
+
+
+def _risk_tier_codes(scores: np.ndarray) -> np.ndarray:
+    """Tier index (position in ``RISK_TIERS``) for each score, via one binary search."""
+    return np.searchsorted(_TIER_BOUNDS, _clip_01_array(scores), side="right")
+
+
+def _risk_tier_categorical(codes: np.ndarray) -> pd.Categorical:
+    """Wrap tier indices as an ordered ``low < moderate < high < critical`` Categorical.
+
+    The codes are stored as-is (int8 in pandas), so no per-row label strings
+    are allocated.
     """
-    score = _clip_01(score)
-    for tier, (lo, hi) in RISK_TIERS.items():
-        if lo <= score < hi:
-            return tier
-    return "critical"
+    import pandas as pd
+
+    return pd.Categorical.from_codes(codes, categories=list(_TIER_LABELS), ordered=True)
+
+
+# ---------------------------------------------------------------------------
+# Batch inputs
+# ---------------------------------------------------------------------------
+
+# Raw input columns for batch scoring, in kernel argument order.
+_SCORE_INPUT_COLUMNS = (
+    "completeness_rate",
+    "mapping_coverage",
+    "variance_ratio",
+    "cutpoint_shift",
+    "measure_weight",
+)
+
+_SCORE_REQUIRED_COLUMNS = frozenset(_SCORE_INPUT_COLUMNS)
+
+# Columns ContractAccumulator.update reads from a scored frame.
+_AGGREGATE_REQUIRED_COLUMNS = frozenset({"shock_index", "measure_weight"})
+
+# Factor parameters held by ShockIndexCalculator; all must be positive.
+_PARAMETER_NAMES = ("baseline", "guardrail", "max_shift", "max_weight", "sensitivity")
+
+# The same parameters in the order the batch methods take them as overrides.
+_BATCH_PARAMETER_NAMES = ("guardrail", "max_shift", "max_weight", "sensitivity", "baseline")
+
+# Default factor columns for ``calculate_batch`` (as appended by score_dataframe).
+_FACTOR_COLUMNS = {"ccs": "ccs", "eav": "eav", "cpr": "cpr", "wm": "wm"}
+
+# Frames at or below this many rows are not worth the Numba dispatch.
+_NUMBA_MIN_ROWS = 10_000
+
+# Batch precisions; the Numba kernels only compile float32 and float64 loops.
+_BATCH_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+def _score_inputs(df: pd.DataFrame, dtype: npt.DTypeLike = np.float64) -> list[np.ndarray]:
+    """Return the batch input columns of *df* as *dtype* arrays.
+
+    Missing values become NaN, which the factor kernels clamp like the
+    scalar helpers do. Scoring parameters are validated by the calculator.
+    """
+    missing = _SCORE_REQUIRED_COLUMNS.difference(df.columns)
+    if missing:
+        raise ValueError(f"DataFrame is missing required columns: {sorted(missing)}")
+    if np.dtype(dtype) not in _BATCH_DTYPES:
+        raise ValueError(f"dtype must be a floating-point type: float32 or float64 (got {np.dtype(dtype)})")
+
+    return [df[col].to_numpy(dtype=dtype, na_value=np.nan) for col in _SCORE_INPUT_COLUMNS]
 
 
 # ---------------------------------------------------------------------------
@@ -151,14 +334,25 @@ class ShockIndexCalculator:
     The default weighting favors completeness and measure weight while still
     accounting for variance and cutpoint pressure.
 
+    ``baseline``, ``guardrail``, ``max_shift``, ``max_weight`` and
+    ``sensitivity`` are the factor parameters used by the batch methods
+    (see ``eav_score``, ``cpr_score`` and ``wm_score``). They are validated
+    once here, so batch scoring does not re-check them per call.
+
     Raises ``ValueError`` during ``__post_init__`` if weights are negative
-    or do not sum to 1.0 (within tolerance of 1e-6).
+    or do not sum to 1.0 (within tolerance of 1e-6), or if a factor
+    parameter is not strictly positive.
     """
 
     alpha_ccs: float = 0.35
     beta_eav: float = 0.25
     gamma_cpr: float = 0.20
     delta_wm: float = 0.20
+    baseline: float = 1.0
+    guardrail: float = 0.05
+    max_shift: float = 0.5
+    max_weight: float = 5.0
+    sensitivity: float = 1.0
 
     def __post_init__(self) -> None:
         weights = [self.alpha_ccs, self.beta_eav, self.gamma_cpr, self.delta_wm]
@@ -167,28 +361,153 @@ class ShockIndexCalculator:
         total = sum(weights)
         if abs(total - 1.0) > 1e-6:
             raise ValueError(f"Weights must sum to 1.0 (got {total})")
+        for name in _PARAMETER_NAMES:
+            _require_positive(name, getattr(self, name))
+
+    @property
+    def _w(self) -> np.ndarray:
+        """Weight vector for the array paths, built from the current fields.
+
+        Derived on each use (four elements, negligible next to the arrays it
+        multiplies) so reassigning a weight field is always honored.
+        """
+        return np.array([self.alpha_ccs, self.beta_eav, self.gamma_cpr, self.delta_wm])
+
+    def _batch_params(
+        self,
+        guardrail: float | None,
+        max_shift: float | None,
+        max_weight: float | None,
+        sensitivity: float | None,
+        baseline: float | None,
+    ) -> tuple[float, float, float, float, float]:
+        """Resolve per-call parameter overrides against the calculator's own.
+
+        ``None`` selects the (already validated) field; only explicit
+        overrides are checked.
+        """
+        resolved = []
+        overrides = (guardrail, max_shift, max_weight, sensitivity, baseline)
+        for name, value in zip(_BATCH_PARAMETER_NAMES, overrides):
+            if value is None:
+                value = getattr(self, name)
+            else:
+                _require_positive(name, value)
+            resolved.append(value)
+        return tuple(resolved)
+
+    def calculate(
+        self,
+        ccs: float | npt.ArrayLike,
+        eav: float | npt.ArrayLike,
+        cpr: float | npt.ArrayLike,
+        wm: float | npt.ArrayLike,
+    ) -> float | np.ndarray:
+        """Compute weighted ECDS Shock Index from normalized inputs.
+
+        Equal-length arrays (or anything that broadcasts) are clamped and
+        combined with one dot product against the weight vector, returning
+        an ndarray.
+        """
+        if not (
+            isinstance(ccs, _SCALAR_TYPES)
+            and isinstance(eav, _SCALAR_TYPES)
+            and isinstance(cpr, _SCALAR_TYPES)
+            and isinstance(wm, _SCALAR_TYPES)
+        ):
+            factors = np.broadcast_arrays(*(_as_float_array(x) for x in (ccs, eav, cpr, wm)))
+            return _clip_01_array(_clip_01_array(np.stack(factors, axis=-1)) @ self._w)
+
+        # The _clip_01 comparison clamp is inlined rather than called five
+        # times; this is the hot path for single-mode and per-row callers.
+        ccs = ccs if 0.0 <= ccs <= 1.0 else (0.0 if ccs < 0.0 else 1.0)
+        eav = eav if 0.0 <= eav <= 1.0 else (0.0 if eav < 0.0 else 1.0)
+        cpr = cpr if 0.0 <= cpr <= 1.0 else (0.0 if cpr < 0.0 else 1.0)
+        wm = wm if 0.0 <= wm <= 1.0 else (0.0 if wm < 0.0 else 1.0)
+        weighted = self.alpha_ccs * ccs + self.beta_eav * eav + self.gamma_cpr * cpr + self.delta_wm * wm
+        return weighted if 0.0 <= weighted <= 1.0 else (0.0 if weighted < 0.0 else 1.0)
+
+    def _combine_clipped(self, ccs: float, eav: float, cpr: float, wm: float) -> float:
+        """Scalar ``calculate`` for factors already clipped to [0, 1].
+
+        The factor helpers (``ccs_score`` etc.) always return values in
+        range, so only the weighted sum is clipped.
+        """
+        return _clip_01(
+            self.alpha_ccs * ccs
+            + self.beta_eav * eav
+            + self.gamma_cpr * cpr
+            + self.delta_wm * wm
+        )
+
+    def _calculate_clipped_arrays(
+        self,
+        ccs: np.ndarray,
+        eav: np.ndarray,
+        cpr: np.ndarray,
+        wm: np.ndarray,
+    ) -> np.ndarray:
+        """Vectorized ``calculate`` for factor arrays already clipped to [0, 1].
+
+        Skips the per-input clamps; only the weighted sum is clipped. Arrays
+        longer than ``_NUMBA_MIN_ROWS`` go through the compiled parallel
+        combine ufunc when numba is installed and the factors are float32 or
+        float64, the only loops it has.
+        """
+        result_dtype = np.result_type(ccs, eav, cpr, wm)
+        combine = None
+        if np.size(ccs) > _NUMBA_MIN_ROWS and result_dtype in _BATCH_DTYPES:
+            combine = _kernels.combine_ufunc()
+        if combine is not None:
+            # Weights in the factors' dtype so float32 inputs select the float32 loop.
+            weights = (self.alpha_ccs, self.beta_eav, self.gamma_cpr, self.delta_wm)
+            return combine(ccs, eav, cpr, wm, *map(result_dtype.type, weights))
 
-    def calculate(self, ccs: float, eav: float, cpr: float, wm: float) -> float:
-        """Compute weighted ECDS Shock Index from normalized inputs."""
         weighted = (
-            self.alpha_ccs * _clip_01(ccs)
-            + self.beta_eav * _clip_01(eav)
-            + self.gamma_cpr * _clip_01(cpr)
-            + self.delta_wm * _clip_01(wm)
+            self.alpha_ccs * ccs
+            + self.beta_eav * eav
+            + self.gamma_cpr * cpr
+            + self.delta_wm * wm
         )
-        return _clip_01(weighted)
+        return _clip_01_array(weighted)
 
     # ------------------------------------------------------------------
     # Batch helpers
     # ------------------------------------------------------------------
 
+    def calculate_batch(
+        self,
+        df: pd.DataFrame,
+        cols: Mapping[str, str] | None = None,
+    ) -> pd.Series:
+        """Apply :meth:`calculate` to precomputed factor columns of a DataFrame.
+
+        *cols* maps each factor (``ccs``, ``eav``, ``cpr``, ``wm``) to the
+        column holding it and defaults to columns of the same names. Returns
+        a ``shock_index`` Series aligned to ``df.index``; use this instead of
+        ``df.apply(..., axis=1)``.
+        """
+        import pandas as pd
+
+        cols = _FACTOR_COLUMNS if cols is None else {**_FACTOR_COLUMNS, **cols}
+        missing = {cols[factor] for factor in _FACTOR_COLUMNS}.difference(df.columns)
+        if missing:
+            raise ValueError(f"DataFrame is missing required columns: {sorted(missing)}")
+
+        factors = [
+            df[cols[factor]].to_numpy(dtype=np.float64, na_value=np.nan) for factor in _FACTOR_COLUMNS
+        ]
+        return pd.Series(self.calculate(*factors), index=df.index, name="shock_index")
+
     def score_dataframe(
         self,
         df: pd.DataFrame,
-        guardrail: float = 0.05,
-        max_shift: float = 0.5,
-        max_weight: float = 5.0,
-        sensitivity: float = 1.0,
+        guardrail: float | None = None,
+        max_shift: float | None = None,
+        max_weight: float | None = None,
+        sensitivity: float | None = None,
+        baseline: float | None = None,
+        dtype: npt.DTypeLike = np.float64,
     ) -> pd.DataFrame:
         """Compute shock index for each row of a DataFrame.
 
@@ -196,40 +515,140 @@ class ShockIndexCalculator:
             completeness_rate, mapping_coverage, variance_ratio,
             cutpoint_shift, measure_weight
 
-        Returns the input DataFrame with new columns appended:
+        Returns a new DataFrame (the input is not modified) with columns
+        appended:
             ccs, eav, cpr, wm, shock_index, risk_tier
-        """
-        required = {
-            "completeness_rate",
-            "mapping_coverage",
-            "variance_ratio",
-            "cutpoint_shift",
-            "measure_weight",
-        }
-        missing = required - set(df.columns)
-        if missing:
-            raise ValueError(f"DataFrame is missing required columns: {sorted(missing)}")
 
-        result = df.copy()
-        result["ccs"] = result.apply(
-            lambda r: ccs_score(r["completeness_rate"], r["mapping_coverage"]),
-            axis=1,
+        ``risk_tier`` is an ordered Categorical (``low < moderate < high <
+        critical``), so it can be compared and sorted by severity.
+
+        ``guardrail``, ``max_shift``, ``max_weight``, ``sensitivity`` and
+        ``baseline`` default to the calculator's fields.
+
+        ``dtype`` sets the floating-point precision (``np.float32`` or
+        ``np.float64``) of the computation and of the appended score
+        columns. ``np.float32`` halves memory traffic
+        on large frames; scores then agree with the default ``np.float64``
+        to about 1e-6, so a score within that distance of a tier boundary
+        may land in the neighboring tier.
+        """
+        guardrail, max_shift, max_weight, sensitivity, baseline = self._batch_params(
+            guardrail, max_shift, max_weight, sensitivity, baseline
         )
-        result["eav"] = result["variance_ratio"].apply(
-            lambda v: eav_score(v, sensitivity=sensitivity),
+        completeness, coverage, variance, shift, weight = _score_inputs(df, dtype)
+        ccs = _ccs_array(completeness, coverage)
+        eav = _eav_array(variance, baseline, sensitivity)
+        cpr = _cpr_array(shift, guardrail, max_shift)
+        wm = _wm_array(weight, max_weight)
+        shock_index = self._calculate_clipped_arrays(ccs, eav, cpr, wm)
+        return df.assign(
+            ccs=ccs,
+            eav=eav,
+            cpr=cpr,
+            wm=wm,
+            shock_index=shock_index,
+            risk_tier=_risk_tier_categorical(_risk_tier_codes(shock_index)),
+        )
+
+    def score_dataframe_fast(
+        self,
+        df: pd.DataFrame,
+        guardrail: float | None = None,
+        max_shift: float | None = None,
+        max_weight: float | None = None,
+        sensitivity: float | None = None,
+        baseline: float | None = None,
+        dtype: npt.DTypeLike = np.float64,
+    ) -> pd.DataFrame:
+        """Like :meth:`score_dataframe`, using a fused Numba kernel for large frames.
+
+        Frames with more than ``_NUMBA_MIN_ROWS`` rows are scored in a single
+        parallel pass over the inputs when ``numba`` is installed; smaller
+        frames, or environments without numba, use :meth:`score_dataframe`.
+        Results match it to floating-point rounding.
+        """
+        kernel = _kernels.score_kernel() if len(df) > _NUMBA_MIN_ROWS else None
+        if kernel is None:
+            return self.score_dataframe(
+                df,
+                guardrail=guardrail,
+                max_shift=max_shift,
+                max_weight=max_weight,
+                sensitivity=sensitivity,
+                baseline=baseline,
+                dtype=dtype,
+            )
+
+        guardrail, max_shift, max_weight, sensitivity, baseline = self._batch_params(
+            guardrail, max_shift, max_weight, sensitivity, baseline
         )
-        result["cpr"] = result["cutpoint_shift"].apply(
-            lambda v: cpr_score(v, guardrail=guardrail, max_shift=max_shift),
+        inputs = _score_inputs(df, dtype)
+        n = len(df)
+        ccs, eav, cpr, wm, shock_index = (np.empty(n, dtype=dtype) for _ in range(5))
+        tier = np.empty(n, dtype=np.intp)
+        kernel(
+            *inputs,
+            baseline,
+            sensitivity,
+            guardrail,
+            max_shift,
+            max_weight,
+            _CPR_LATENT_SHARE,
+            self.alpha_ccs,
+            self.beta_eav,
+            self.gamma_cpr,
+            self.delta_wm,
+            _TIER_BOUNDS,
+            ccs,
+            eav,
+            cpr,
+            wm,
+            shock_index,
+            tier,
         )
-        result["wm"] = result["measure_weight"].apply(
-            lambda v: wm_score(v, max_weight=max_weight),
+        return df.assign(
+            ccs=ccs,
+            eav=eav,
+            cpr=cpr,
+            wm=wm,
+            shock_index=shock_index,
+            risk_tier=_risk_tier_categorical(tier),
         )
-        result["shock_index"] = result.apply(
-            lambda r: self.calculate(ccs=r["ccs"], eav=r["eav"], cpr=r["cpr"], wm=r["wm"]),
-            axis=1,
+
+    def _score_rows_python(
+        self,
+        df: pd.DataFrame,
+        guardrail: float | None = None,
+        max_shift: float | None = None,
+        max_weight: float | None = None,
+        sensitivity: float | None = None,
+        baseline: float | None = None,
+    ) -> pd.DataFrame:
+        """Reference implementation of :meth:`score_dataframe` built on the scalar helpers.
+
+        Rows are walked by zipping the input column arrays, so no per-row
+        Series is built. Kept as a correctness fallback for the vectorized
+        and Numba paths.
+        """
+        import pandas as pd
+
+        guardrail, max_shift, max_weight, sensitivity, baseline = self._batch_params(
+            guardrail, max_shift, max_weight, sensitivity, baseline
         )
-        result["risk_tier"] = result["shock_index"].apply(classify_risk)
-        return result
+        inputs = _score_inputs(df)
+        rows = []
+        for completeness, coverage, variance, shift, weight in zip(*inputs):
+            ccs = ccs_score(completeness, coverage)
+            eav = eav_score(variance, baseline=baseline, sensitivity=sensitivity)
+            cpr = cpr_score(shift, guardrail=guardrail, max_shift=max_shift)
+            wm = wm_score(weight, max_weight=max_weight)
+            shock = self._combine_clipped(ccs, eav, cpr, wm)
+            rows.append((ccs, eav, cpr, wm, shock, classify_risk(shock)))
+
+        columns = ["ccs", "eav", "cpr", "wm", "shock_index", "risk_tier"]
+        derived = pd.DataFrame.from_records(rows, columns=columns, index=df.index)
+        tiers = pd.Categorical(derived["risk_tier"], categories=list(_TIER_LABELS), ordered=True)
+        return df.assign(**derived.assign(risk_tier=tiers))
 
     def aggregate_contract(self, scored_df: pd.DataFrame) -> dict[str, Any]:
         """Aggregate scored measures to a contract-level summary.
@@ -244,32 +663,200 @@ class ShockIndexCalculator:
             measure_count        – number of measures
             risk_tier            – tier for the weighted index
         """
-        required = {"shock_index", "measure_weight"}
-        missing = required - set(scored_df.columns)
+        return ContractAccumulator().update(scored_df).summary()
+
+
+class _SharedCalculator(ShockIndexCalculator):
+    """A ``ShockIndexCalculator`` whose fields cannot be reassigned.
+
+    ``make_calculator`` hands the same instance to every caller, so changes
+    are rejected rather than leaking from one caller to the others.
+    """
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        object.__setattr__(self, "_sealed", True)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_sealed", False):
+            raise FrozenInstanceError(
+                f"cannot assign to field {name!r} of a shared calculator; "
+                "construct ShockIndexCalculator for a mutable one"
+            )
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r} of a shared calculator")
+
+    # The dataclass __eq__ and __repr__ key on the exact class; compare and
+    # display as the public ShockIndexCalculator instead.
+    def _field_values(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, f.name) for f in fields(ShockIndexCalculator))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ShockIndexCalculator):
+            return NotImplemented
+        return self._field_values() == _SharedCalculator._field_values(other)
+
+    __hash__ = None  # type: ignore[assignment]  # unhashable, like the parent
+
+    def __repr__(self) -> str:
+        args = ", ".join(
+            f"{f.name}={getattr(self, f.name)!r}" for f in fields(ShockIndexCalculator)
+        )
+        return f"ShockIndexCalculator({args})"
+
+
+@lru_cache(maxsize=32)
+def make_calculator(
+    alpha_ccs: float = 0.35,
+    beta_eav: float = 0.25,
+    gamma_cpr: float = 0.20,
+    delta_wm: float = 0.20,
+) -> ShockIndexCalculator:
+    """Return a shared, already-validated calculator for the given weights.
+
+    Repeated calls with the same weights return the same instance, so code
+    that needs a calculator per request skips validation and setup. The
+    instance is immutable: assigning to a field raises
+    ``dataclasses.FrozenInstanceError``. Construct ``ShockIndexCalculator``
+    directly for an instance you intend to modify.
+    """
+    return _SharedCalculator(alpha_ccs, beta_eav, gamma_cpr, delta_wm)
+
+
+def score_cohort(
+    df: pd.DataFrame,
+    calc: ShockIndexCalculator | None = None,
+    guardrail: float | None = None,
+    max_shift: float | None = None,
+    max_weight: float | None = None,
+    sensitivity: float | None = None,
+    baseline: float | None = None,
+    dtype: npt.DTypeLike = np.float64,
+) -> pd.DataFrame:
+    """Score a cohort of measures, returning only the composite and its tier.
+
+    Takes the same input columns as ``ShockIndexCalculator.score_dataframe``
+    and returns a new two-column DataFrame (``shock_index``, ``risk_tier``)
+    aligned to ``df.index``, without copying the input columns or keeping
+    the per-factor scores. *calc* defaults to ``make_calculator()``, and
+    parameters left as ``None`` default to its fields.
+
+    ``dtype`` may be a floating-point type, as in ``score_dataframe``, or
+    ``np.uint8`` to store ``shock_index`` quantized to 1/255 steps for
+    compact storage (``arr / 255.0`` recovers it to within 1/510). Tiers
+    are assigned before quantizing.
+    """
+    import pandas as pd
+
+    if calc is None:
+        calc = make_calculator()
+    guardrail, max_shift, max_weight, sensitivity, baseline = calc._batch_params(
+        guardrail, max_shift, max_weight, sensitivity, baseline
+    )
+    quantize = np.dtype(dtype) == np.uint8
+    completeness, coverage, variance, shift, weight = _score_inputs(
+        df, np.float64 if quantize else dtype
+    )
+    factors = np.stack(
+        [
+            _ccs_array(completeness, coverage),
+            _eav_array(variance, baseline, sensitivity),
+            _cpr_array(shift, guardrail, max_shift),
+            _wm_array(weight, max_weight),
+        ]
+    )
+    # Cast the weights so float32 factors are not promoted by the dot product.
+    shock_index = _clip_01_array(calc._w.astype(factors.dtype, copy=False) @ factors)
+    risk_tier = _risk_tier_categorical(_risk_tier_codes(shock_index))
+    if quantize:
+        shock_index = (shock_index * 255.0 + 0.5).astype(np.uint8)
+    return pd.DataFrame(
+        {
+            "shock_index": shock_index,
+            "risk_tier": risk_tier,
+        },
+        index=df.index,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Contract aggregation
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ContractAccumulator:
+    """Running totals for a contract-level summary over scored chunks.
+
+    Feed each output of ``score_dataframe`` to :meth:`update`, then call
+    :meth:`summary`. A single update over the whole frame is exactly
+    ``ShockIndexCalculator.aggregate_contract``; streaming callers update
+    once per chunk so only the totals are held in memory. Missing scores
+    and weights are skipped, as in pandas reductions.
+    """
+
+    weighted_sum: float = 0.0
+    total_weight: float = 0.0
+    score_sum: float = 0.0
+    score_count: int = 0
+    max_score: float = math.nan
+    measure_count: int = 0
+
+    def update(self, scored_df: pd.DataFrame) -> ContractAccumulator:
+        """Add the measures in *scored_df* to the running totals."""
+        missing = _AGGREGATE_REQUIRED_COLUMNS.difference(scored_df.columns)
         if missing:
             raise ValueError(f"DataFrame is missing required columns: {sorted(missing)}")
 
-        total_weight = scored_df["measure_weight"].sum()
-        if total_weight == 0:
+        scores = scored_df["shock_index"].to_numpy(dtype=np.float64, na_value=np.nan)
+        weights = scored_df["measure_weight"].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        # Missing values contribute nothing, matching pandas' skipna reductions.
+        has_score = ~np.isnan(scores)
+        count = int(np.count_nonzero(has_score))
+        if count < len(scores):
+            scores = np.where(has_score, scores, 0.0)
+        if np.isnan(weights).any():
+            weights = np.where(np.isnan(weights), 0.0, weights)
+
+        self.weighted_sum += float(np.dot(scores, weights))
+        self.total_weight += float(weights.sum())
+        self.score_sum += float(scores.sum())
+        self.score_count += count
+        if count:
+            self.max_score = float(np.fmax(self.max_score, np.fmax.reduce(scores[has_score])))
+        self.measure_count += len(scored_df)
+        return self
+
+    def summary(self) -> dict[str, Any]:
+        """Return the contract summary for all measures seen so far.
+
+        Same keys as ``ShockIndexCalculator.aggregate_contract``.
+        """
+        if self.total_weight == 0:
             weighted = 0.0
         else:
-            weighted = (
-                scored_df["shock_index"] * scored_df["measure_weight"]
-            ).sum() / total_weight
+            weighted = self.weighted_sum / self.total_weight
+        mean = self.score_sum / self.score_count if self.score_count else math.nan
 
         return {
             "weighted_shock_index": round(weighted, 4),
-            "mean_shock_index": round(scored_df["shock_index"].mean(), 4),
-            "max_shock_index": round(scored_df["shock_index"].max(), 4),
-            "measure_count": len(scored_df),
+            "mean_shock_index": round(mean, 4),
+            "max_shock_index": round(self.max_score, 4),
+            "measure_count": self.measure_count,
             "risk_tier": classify_risk(weighted),
         }
 
 
 __all__ = [
     "RISK_TIERS",
+    "ContractAccumulator",
     "ShockIndexCalculator",
     "classify_risk",
+    "make_calculator",
+    "score_cohort",
     "ccs_score",
     "cpr_score",
     "eav_score",
@@ -0,0 +1,45 @@
+"""Optional Numba kernels for large-batch scoring.
+
+``numba`` is not a required dependency. Each accessor returns the compiled
+kernel from ``ecds_shock_index._numba_kernels``, or ``None`` when numba is
+not installed so callers can fall back to the NumPy implementation. numba
+is only imported on first use.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=None)
+def _load() -> Any:
+    try:
+        from ecds_shock_index import _numba_kernels
+    except ImportError:
+        return None
+    return _numba_kernels
+
+
+def score_kernel() -> Callable[..., Any] | None:
+    """Return the fused row-scoring kernel, or ``None`` without numba.
+
+    The kernel computes CCS, EAV, CPR, WM, the weighted shock index and the
+    tier index for every row in one parallel pass, writing into the
+    caller-allocated output arrays.
+    """
+    module = _load()
+    return None if module is None else module.score_rows
+
+
+def combine_ufunc() -> Callable[..., Any] | None:
+    """Return the parallel combine ufunc, or ``None`` without numba.
+
+    ``combine(ccs, eav, cpr, wm, alpha, beta, gamma, delta)`` computes the
+    clipped weighted shock index for factors already in [0, 1]. The weights
+    are broadcast scalar arguments, so one compiled (and disk-cached) ufunc
+    serves every calculator rather than one compile per weight tuple.
+    """
+    module = _load()
+    return None if module is None else module.combine_clipped
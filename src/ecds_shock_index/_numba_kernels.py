@@ -0,0 +1,106 @@
+"""Numba-compiled batch kernels.
+
+Importing this module requires ``numba``; use the accessors in
+``ecds_shock_index._kernels``, which return ``None`` when it is missing.
+The kernels are defined at module level so their compiled code can be
+cached on disk across processes.
+"""
+
+from __future__ import annotations
+
+import numba
+
+# IEEE-preserving fast-math subset: allow FMA contraction and reciprocal
+# multiplication, but keep NaN/inf semantics so missing inputs clamp the same
+# way as the NumPy path.
+_FASTMATH = {"contract", "arcp", "nsz"}
+
+
+@numba.njit(inline="always")
+def _clip_01(value):
+    # NaN fails both comparisons and clamps to 1.0, like the scalar _clip_01.
+    if 0.0 <= value <= 1.0:
+        return value
+    return 0.0 if value < 0.0 else 1.0
+
+
+@numba.njit(inline="always")
+def _cap_1(value):
+    # Upper clamp for factors that are non-negative by construction.
+    return value if value < 1.0 else 1.0
+
+
+# Scalar factor kernels mirroring ccs_score, eav_score, cpr_score and wm_score
+# (parameters are validated by the caller). They are for jitted callers such
+# as score_rows, into which they inline; calling them from Python is slower
+# than the pure-Python helpers because of dispatcher overhead.
+
+
+@numba.njit(inline="always", cache=True)
+def _ccs_kernel(completeness, coverage):
+    return _clip_01(1.0 - (completeness + coverage) * 0.5)
+
+
+@numba.njit(inline="always", cache=True)
+def _eav_kernel(variance, inv_baseline, inv_sensitivity):
+    return _cap_1(abs(variance * inv_baseline - 1.0) * inv_sensitivity)
+
+
+@numba.njit(inline="always", cache=True)
+def _cpr_kernel(shift, guardrail, inv_guardrail, inv_max_shift, latent_share):
+    s = abs(shift)
+    realized = min(s, guardrail) * inv_guardrail
+    latent = max(s - guardrail, 0.0) * inv_max_shift
+    return _cap_1((1.0 - latent_share) * realized + latent_share * latent)
+
+
+@numba.njit(inline="always", cache=True)
+def _wm_kernel(weight, inv_max_weight):
+    return _clip_01(weight * inv_max_weight)
+
+
+@numba.njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def score_rows(
+    completeness, coverage, variance, shift, weight,
+    baseline, sensitivity, guardrail, max_shift, max_weight, latent_share,
+    alpha, beta, gamma, delta, tier_edges,
+    ccs_out, eav_out, cpr_out, wm_out, shock_out, tier_out,
+):
+    """Score every row in one parallel pass, writing into the output arrays."""
+    # Loop-invariant reciprocals: multiply in the loop instead of dividing.
+    inv_baseline = 1.0 / baseline
+    inv_sensitivity = 1.0 / sensitivity
+    inv_guardrail = 1.0 / guardrail
+    inv_max_shift = 1.0 / max_shift
+    inv_max_weight = 1.0 / max_weight
+
+    for i in numba.prange(completeness.shape[0]):
+        ccs = _ccs_kernel(completeness[i], coverage[i])
+        eav = _eav_kernel(variance[i], inv_baseline, inv_sensitivity)
+        cpr = _cpr_kernel(shift[i], guardrail, inv_guardrail, inv_max_shift, latent_share)
+        wm = _wm_kernel(weight[i], inv_max_weight)
+        shock = _clip_01(alpha * ccs + beta * eav + gamma * cpr + delta * wm)
+
+        tier = 0
+        while tier < tier_edges.shape[0] and shock >= tier_edges[tier]:
+            tier += 1
+
+        ccs_out[i] = ccs
+        eav_out[i] = eav
+        cpr_out[i] = cpr
+        wm_out[i] = wm
+        shock_out[i] = shock
+        tier_out[i] = tier
+
+
+@numba.vectorize(
+    [
+        "float64(float64, float64, float64, float64, float64, float64, float64, float64)",
+        "float32(float32, float32, float32, float32, float32, float32, float32, float32)",
+    ],
+    target="parallel",
+    cache=True,
+)
+def combine_clipped(ccs, eav, cpr, wm, alpha, beta, gamma, delta):
+    """Weighted shock index of factors already in [0, 1]; only the sum is clipped."""
+    return _clip_01(alpha * ccs + beta * eav + gamma * cpr + delta * wm)
@@ -2,60 +2,297 @@
 
 from __future__ import annotations
 
+import glob
+import hashlib
+import importlib.util
+import os
+import tempfile
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
-ECDS_REQUIRED_COLUMNS = {
-    "measure_id",
-    "completeness_rate",
-    "mapping_coverage",
-    "variance_ratio",
-    "cutpoint_shift",
+ECDS_REQUIRED_COLUMNS = frozenset(
+    {
+        "measure_id",
+        "completeness_rate",
+        "mapping_coverage",
+        "variance_ratio",
+        "cutpoint_shift",
+    }
+)
+
+CMS_REQUIRED_COLUMNS = frozenset(
+    {
+        "measure_id",
+        "measure_weight",
+    }
+)
+
+# Use the multithreaded PyArrow CSV parser when it is installed.
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Explicit parse dtypes so the CSV reader skips type inference. The keys are
+# also the set of columns each loader reads; anything else is skipped.
+# measure_id is categorical: a small shared dictionary of codes, so joins on it
+# hash integers rather than strings.
+_ECDS_DTYPES = {
+    "measure_id": "category",
+    "completeness_rate": "float64",
+    "mapping_coverage": "float64",
+    "variance_ratio": "float64",
+    "cutpoint_shift": "float64",
 }
 
-CMS_REQUIRED_COLUMNS = {
-    "measure_id",
-    "measure_weight",
+_CMS_DTYPES = {
+    "measure_id": "category",
+    "measure_name": "string",  # optional; kept for readable batch output
+    "measure_weight": "float64",
 }
 
 
-def _validate_columns(df: pd.DataFrame, required: set[str], source: str) -> None:
+def _validate_columns(df: pd.DataFrame, required: frozenset[str], source: str) -> None:
     """Raise ``ValueError`` if *df* is missing any *required* columns."""
-    missing = required - set(df.columns)
+    missing = required.difference(df.columns)
     if missing:
         raise ValueError(f"{source} is missing required columns: {sorted(missing)}")
 
 
-def load_ncqa_ecds(path: str | Path) -> pd.DataFrame:
-    """Load NCQA ECDS results CSV.
+def default_cache_dir() -> Path:
+    """Return the directory used for cached Parquet copies of CSV inputs.
+
+    Honors ``$XDG_CACHE_HOME`` and falls back to ``~/.cache``.
+    """
+    root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "ecds-shock-index"
+
+
+def _read_csv(
+    path: str | Path,
+    dtypes: dict[str, str],
+    required: frozenset[str],
+    source: str,
+) -> pd.DataFrame:
+    """Validate the header of *path*, then parse only the columns in *dtypes*.
+
+    Parsing goes through the multithreaded PyArrow engine when ``pyarrow`` is
+    installed, and the default C engine otherwise; either way the columns
+    come back with the dtypes in *dtypes*.
+    """
+    header = pd.read_csv(path, nrows=0)
+    _validate_columns(header, required, source)
+    usecols = [col for col in header.columns if col in dtypes]
+    dtype = {col: dtypes[col] for col in usecols}
+    if _HAS_PYARROW:
+        return pd.read_csv(path, usecols=usecols, dtype=dtype, engine="pyarrow")
+    return pd.read_csv(path, usecols=usecols, dtype=dtype)
+
+
+def _read_parquet(
+    path: str | Path,
+    dtypes: dict[str, str],
+    required: frozenset[str],
+    source: str,
+) -> pd.DataFrame:
+    """Read only the schema columns in *dtypes* from a Parquet file."""
+    import pyarrow.parquet as pq
+
+    header = pd.DataFrame(columns=pq.read_schema(path).names)
+    _validate_columns(header, required, source)
+    usecols = [col for col in header.columns if col in dtypes]
+    df = pd.read_parquet(path, columns=usecols)
+    return df.astype({col: dtypes[col] for col in usecols})
+
+
+def _read_cached_csv(
+    path: str | Path,
+    dtypes: dict[str, str],
+    required: frozenset[str],
+    source: str,
+    cache_dir: str | Path,
+) -> pd.DataFrame:
+    """Read *path* through a Parquet copy keyed by its location, mtime and size.
+
+    On a miss the CSV is parsed and the result written to *cache_dir*,
+    replacing any older copy of the same file. The copy is written to a
+    temporary file and renamed into place, so an interrupted or concurrent
+    run never leaves a partial entry; an entry that cannot be read anyway
+    is discarded and the CSV reparsed. Cache write failures are ignored;
+    the parsed frame is returned regardless.
+    """
+    stat = os.stat(path)
+    resolved = os.path.realpath(path)
+    digest = hashlib.sha1(resolved.encode("utf-8")).hexdigest()[:16]
+    prefix = f"{Path(resolved).stem}-{digest}"
+    cache_dir = Path(cache_dir)
+    cached = cache_dir / f"{prefix}-{stat.st_mtime_ns}-{stat.st_size}.parquet"
+    if cached.exists():
+        try:
+            return _read_parquet(cached, dtypes, required, source)
+        except (OSError, ValueError):
+            # Truncated or otherwise unreadable (pyarrow.ArrowInvalid is a
+            # ValueError): treat as a miss.
+            cached.unlink(missing_ok=True)
+
+    df = _read_csv(path, dtypes, required, source)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix=f".{prefix}-", suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp, index=False)
+            os.replace(tmp, cached)
+        finally:
+            Path(tmp).unlink(missing_ok=True)
+        for stale in cache_dir.glob(f"{glob.escape(prefix)}-*.parquet"):
+            if stale != cached:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+    return df
+
+
+def _load(
+    path: str | Path,
+    dtypes: dict[str, str],
+    required: frozenset[str],
+    source: str,
+    cache_dir: str | Path | None,
+) -> pd.DataFrame:
+    """Dispatch to the Parquet, cached-CSV or plain CSV reader for *path*."""
+    if Path(path).suffix.lower() == ".parquet":
+        return _read_parquet(path, dtypes, required, source)
+    if cache_dir is not None and _HAS_PYARROW:
+        return _read_cached_csv(path, dtypes, required, source, cache_dir)
+    return _read_csv(path, dtypes, required, source)
+
+
+def load_ncqa_ecds(path: str | Path, cache_dir: str | Path | None = None) -> pd.DataFrame:
+    """Load NCQA ECDS results from a CSV or Parquet file.
 
     Expected columns:
         measure_id, completeness_rate, mapping_coverage,
         variance_ratio, cutpoint_shift
+
+    Only these columns are read; any others in the file are skipped. Paths
+    ending in ``.parquet`` are read directly. When *cache_dir* is given (and
+    ``pyarrow`` is installed) a CSV is parsed once and re-read from a Parquet
+    copy in that directory until the file changes.
     """
-    df = pd.read_csv(path)
-    _validate_columns(df, ECDS_REQUIRED_COLUMNS, "NCQA ECDS file")
-    return df
+    return _load(path, _ECDS_DTYPES, ECDS_REQUIRED_COLUMNS, "NCQA ECDS file", cache_dir)
+
+
+@lru_cache(maxsize=8)
+def _load_cms_cached(
+    resolved: str,
+    mtime_ns: int,
+    size: int,
+    cache_dir: str | Path | None,
+) -> pd.DataFrame:
+    """Parse a weights file; the stat fields in the key invalidate stale entries."""
+    return _load(resolved, _CMS_DTYPES, CMS_REQUIRED_COLUMNS, "CMS measure weights file", cache_dir)
 
 
-def load_cms_measure_weights(path: str | Path) -> pd.DataFrame:
-    """Load CMS Stars measure definitions/weights CSV.
+def load_cms_measure_weights(path: str | Path, cache_dir: str | Path | None = None) -> pd.DataFrame:
+    """Load CMS Stars measure definitions/weights from a CSV or Parquet file.
 
     Expected columns:
         measure_id, measure_weight
+
+    ``measure_name`` is kept when present; any other columns are skipped.
+    Parquet input and *cache_dir* behave as in :func:`load_ncqa_ecds`.
+
+    The weights table is small and re-read by every scoring run, so parsed
+    files are kept in memory until their modification time or size changes.
+    Each call returns a copy, which callers are free to modify.
     """
-    df = pd.read_csv(path)
-    _validate_columns(df, CMS_REQUIRED_COLUMNS, "CMS measure weights file")
-    return df
+    stat = os.stat(path)
+    return _load_cms_cached(os.path.realpath(path), stat.st_mtime_ns, stat.st_size, cache_dir).copy()
+
+
+def iter_ncqa_ecds(path: str | Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Yield NCQA ECDS results from a CSV or Parquet file in chunks.
+
+    Columns, dtypes and validation match :func:`load_ncqa_ecds`, but at most
+    *chunk_size* rows are held in memory at a time. Required columns are
+    checked before the first chunk is yielded.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be greater than zero")
+    source = "NCQA ECDS file"
+
+    if Path(path).suffix.lower() == ".parquet":
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(path)
+        header = pd.DataFrame(columns=parquet.schema_arrow.names)
+        _validate_columns(header, ECDS_REQUIRED_COLUMNS, source)
+        usecols = [col for col in header.columns if col in _ECDS_DTYPES]
+        dtype = {col: _ECDS_DTYPES[col] for col in usecols}
+        for batch in parquet.iter_batches(batch_size=chunk_size, columns=usecols):
+            yield batch.to_pandas().astype(dtype)
+        return
+
+    # The PyArrow CSV engine does not support chunked reads; use the C engine.
+    header = pd.read_csv(path, nrows=0)
+    _validate_columns(header, ECDS_REQUIRED_COLUMNS, source)
+    usecols = [col for col in header.columns if col in _ECDS_DTYPES]
+    dtype = {col: _ECDS_DTYPES[col] for col in usecols}
+    with pd.read_csv(path, usecols=usecols, dtype=dtype, chunksize=chunk_size) as reader:
+        yield from reader
+
+
+def _unified_id_dtype(*ids: pd.Series) -> pd.CategoricalDtype:
+    """Categorical dtype whose categories cover every measure_id in *ids*."""
+    categories = None
+    for series in ids:
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            values = series.cat.categories
+        else:
+            values = pd.Index(series.dropna().unique())
+        categories = values if categories is None else categories.union(values)
+    return pd.CategoricalDtype(categories)
+
+
+def _map_weights(ids: pd.Series, weights: Mapping[str, float]) -> pd.Series:
+    """Look up a weight for each measure_id; unmatched ids get NaN."""
+    if not isinstance(ids.dtype, pd.CategoricalDtype):
+        return ids.map(weights)
+    # Look up each category once, then gather by code. The trailing NaN
+    # slot is what code -1 (a missing measure_id) indexes.
+    per_category = ids.cat.categories.map(lambda key: weights.get(key, np.nan))
+    lookup = np.append(np.asarray(per_category, dtype=np.float64), np.nan)
+    return pd.Series(lookup[ids.cat.codes.to_numpy()], index=ids.index)
 
 
 def merge_ecds_and_weights(
     ecds_df: pd.DataFrame,
-    weights_df: pd.DataFrame,
+    weights_df: pd.DataFrame | Mapping[str, float],
 ) -> pd.DataFrame:
-    """Merge ECDS results with Stars measure weights on measure_id."""
-    return ecds_df.merge(weights_df, on="measure_id", how="left")
+    """Left-join Stars measure weights onto ECDS results by measure_id.
+
+    *weights_df* may be a weights DataFrame or a precomputed
+    ``{measure_id: measure_weight}`` mapping. A frame holding only
+    ``measure_id`` and ``measure_weight`` is turned into such a mapping and
+    applied per category code (or with ``Series.map`` for plain string
+    ids); a frame with extra columns (e.g. ``measure_name``) falls back to
+    ``DataFrame.merge`` so those columns are carried through. When either
+    side's ``measure_id`` is categorical, both are cast to one shared
+    categorical dtype first so the merge joins on integer codes. Unmatched
+    measures get a missing weight.
+    """
+    if isinstance(weights_df, pd.DataFrame):
+        if set(weights_df.columns) != CMS_REQUIRED_COLUMNS:
+            left, right = ecds_df["measure_id"], weights_df["measure_id"]
+            if isinstance(left.dtype, pd.CategoricalDtype) or isinstance(right.dtype, pd.CategoricalDtype):
+                dtype = _unified_id_dtype(left, right)
+                ecds_df = ecds_df.astype({"measure_id": dtype})
+                weights_df = weights_df.astype({"measure_id": dtype})
+            return ecds_df.merge(weights_df, on="measure_id", how="left")
+        weights_df = dict(zip(weights_df["measure_id"], weights_df["measure_weight"]))
+    return ecds_df.assign(measure_weight=_map_weights(ecds_df["measure_id"], weights_df))
 
 
 if __name__ == "__main__":
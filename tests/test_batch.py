@@ -2,9 +2,20 @@
 
 import pytest
 
+import numpy as np
 import pandas as pd
 
-from ecds_shock_index import ShockIndexCalculator, classify_risk
+import ecds_shock_index
+from ecds_shock_index import (
+    ContractAccumulator,
+    ShockIndexCalculator,
+    ccs_score,
+    classify_risk,
+    cpr_score,
+    eav_score,
+    score_cohort,
+    wm_score,
+)
 
 
 @pytest.fixture()
@@ -41,6 +52,24 @@ class TestScoreDataframe:
         valid = {"low", "moderate", "high", "critical"}
         assert set(result["risk_tier"].unique()).issubset(valid)
 
+    def test_risk_tiers_match_classify_risk(self, sample_df):
+        calc = ShockIndexCalculator()
+        result = calc.score_dataframe(sample_df)
+        expected = [classify_risk(s) for s in result["shock_index"]]
+        assert list(result["risk_tier"]) == expected
+
+    def test_risk_tier_is_ordered_categorical(self, sample_df):
+        result = ShockIndexCalculator().score_dataframe(sample_df)
+        assert isinstance(result["risk_tier"].dtype, pd.CategoricalDtype)
+        assert list(result["risk_tier"].cat.categories) == ["low", "moderate", "high", "critical"]
+        assert result["risk_tier"].cat.ordered
+        assert (result["risk_tier"] >= "moderate").tolist() == [False, True, True]
+
+    def test_input_not_modified(self, sample_df):
+        before = sample_df.copy()
+        ShockIndexCalculator().score_dataframe(sample_df)
+        pd.testing.assert_frame_equal(sample_df, before)
+
     def test_row_count_preserved(self, sample_df):
         calc = ShockIndexCalculator()
         result = calc.score_dataframe(sample_df)
@@ -52,12 +81,276 @@ class TestScoreDataframe:
         with pytest.raises(ValueError, match="missing required columns"):
             calc.score_dataframe(df)
 
+    def test_factors_match_scalar_functions(self, sample_df):
+        calc = ShockIndexCalculator()
+        result = calc.score_dataframe(sample_df, guardrail=0.04, max_shift=0.3, sensitivity=0.5)
+        for _, row in result.iterrows():
+            assert row["ccs"] == pytest.approx(ccs_score(row["completeness_rate"], row["mapping_coverage"]))
+            assert row["eav"] == pytest.approx(eav_score(row["variance_ratio"], sensitivity=0.5))
+            assert row["cpr"] == pytest.approx(cpr_score(row["cutpoint_shift"], guardrail=0.04, max_shift=0.3))
+            assert row["wm"] == pytest.approx(wm_score(row["measure_weight"]))
+
+    def test_shock_index_matches_calculate(self, sample_df):
+        calc = ShockIndexCalculator(alpha_ccs=0.4, beta_eav=0.2, gamma_cpr=0.2, delta_wm=0.2)
+        result = calc.score_dataframe(sample_df)
+        for _, row in result.iterrows():
+            expected = calc.calculate(ccs=row["ccs"], eav=row["eav"], cpr=row["cpr"], wm=row["wm"])
+            assert row["shock_index"] == pytest.approx(expected)
+
+    def test_unmatched_weight_clips_like_scalar(self, sample_df):
+        sample_df["measure_weight"] = [1, None, 3]
+        calc = ShockIndexCalculator()
+        result = calc.score_dataframe(sample_df)
+        assert result["wm"].iloc[1] == pytest.approx(wm_score(float("nan")))
+
+    def test_invalid_params_raise(self, sample_df):
+        calc = ShockIndexCalculator()
+        with pytest.raises(ValueError, match="guardrail"):
+            calc.score_dataframe(sample_df, guardrail=0)
+        with pytest.raises(ValueError, match="sensitivity"):
+            calc.score_dataframe(sample_df, sensitivity=0)
+        with pytest.raises(ValueError, match="baseline"):
+            calc.score_dataframe(sample_df, baseline=0)
+
+    def test_calculator_params_are_defaults(self, sample_df):
+        calc = ShockIndexCalculator(
+            baseline=1.2, guardrail=0.04, max_shift=0.3, max_weight=3.0, sensitivity=0.5
+        )
+        scored = calc.score_dataframe(sample_df)
+        reference = calc._score_rows_python(sample_df)
+        for col in ["ccs", "eav", "cpr", "wm", "shock_index"]:
+            np.testing.assert_allclose(scored[col], reference[col])
+        expected_eav = [eav_score(v, baseline=1.2, sensitivity=0.5) for v in sample_df["variance_ratio"]]
+        np.testing.assert_allclose(scored["eav"], expected_eav)
+        overridden = calc.score_dataframe(
+            sample_df, guardrail=0.05, max_shift=0.5, max_weight=5.0, sensitivity=1.0, baseline=1.0
+        )
+        default = ShockIndexCalculator().score_dataframe(sample_df)
+        for col in ["eav", "cpr"]:
+            np.testing.assert_allclose(overridden[col], default[col])
+
     def test_custom_max_params(self, sample_df):
         calc = ShockIndexCalculator()
         result = calc.score_dataframe(sample_df, max_shift=1.0, max_weight=3.0)
         assert len(result) == 3
 
 
+@pytest.fixture()
+def large_df():
+    rng = np.random.default_rng(0)
+    n = 500
+    df = pd.DataFrame(
+        {
+            "measure_id": [f"M{i}" for i in range(n)],
+            "completeness_rate": rng.uniform(-0.1, 1.1, n),
+            "mapping_coverage": rng.uniform(0, 1, n),
+            "variance_ratio": rng.uniform(0, 3, n),
+            "cutpoint_shift": rng.normal(0, 0.2, n),
+            "measure_weight": rng.choice([1, 2, 3, 5], n).astype(float),
+        }
+    )
+    df.loc[::50, "measure_weight"] = np.nan
+    return df
+
+
+class TestFloat32Scoring:
+    def test_float32_columns_close_to_float64(self, large_df):
+        calc = ShockIndexCalculator()
+        single = calc.score_dataframe(large_df, dtype=np.float32)
+        double = calc.score_dataframe(large_df)
+        for col in ("ccs", "eav", "cpr", "wm", "shock_index"):
+            assert single[col].dtype == np.float32
+            np.testing.assert_allclose(single[col], double[col], rtol=0, atol=1e-6)
+
+    def test_float32_summary_matches_rounded_float64(self, large_df):
+        calc = ShockIndexCalculator()
+        single = calc.aggregate_contract(calc.score_dataframe(large_df, dtype=np.float32))
+        double = calc.aggregate_contract(calc.score_dataframe(large_df))
+        for key in ("weighted_shock_index", "mean_shock_index", "max_shock_index"):
+            assert single[key] == pytest.approx(double[key], abs=1e-4)
+
+    def test_float32_kernel(self, large_df, monkeypatch):
+        pytest.importorskip("numba")
+        monkeypatch.setattr(ecds_shock_index, "_NUMBA_MIN_ROWS", 0)
+        calc = ShockIndexCalculator()
+        fast = calc.score_dataframe_fast(large_df, dtype=np.float32)
+        assert fast["shock_index"].dtype == np.float32
+        np.testing.assert_allclose(
+            fast["shock_index"], calc.score_dataframe(large_df)["shock_index"], rtol=0, atol=1e-6
+        )
+
+    def test_rejects_non_float_dtype(self, sample_df):
+        with pytest.raises(ValueError, match="floating-point"):
+            ShockIndexCalculator().score_dataframe(sample_df, dtype=np.int64)
+
+    @pytest.mark.parametrize("dtype", [np.float16, np.longdouble])
+    def test_rejects_unsupported_float_dtype(self, large_df, dtype):
+        df = pd.concat([large_df] * (ecds_shock_index._NUMBA_MIN_ROWS // len(large_df) + 1))
+        assert len(df) > ecds_shock_index._NUMBA_MIN_ROWS
+        calc = ShockIndexCalculator()
+        with pytest.raises(ValueError, match="floating-point"):
+            calc.score_dataframe(df, dtype=dtype)
+        with pytest.raises(ValueError, match="floating-point"):
+            calc.score_dataframe_fast(df, dtype=dtype)
+
+
+class TestScoreRowsPython:
+    def test_matches_vectorized_path(self, large_df):
+        calc = ShockIndexCalculator()
+        kwargs = {
+            "guardrail": 0.04,
+            "max_shift": 0.3,
+            "max_weight": 3.0,
+            "sensitivity": 0.5,
+            "baseline": 1.2,
+        }
+        reference = calc._score_rows_python(large_df, **kwargs)
+        result = calc.score_dataframe(large_df, **kwargs)
+        for col in ("ccs", "eav", "cpr", "wm", "shock_index"):
+            np.testing.assert_allclose(result[col], reference[col], rtol=0, atol=1e-12)
+        assert list(result["risk_tier"]) == list(reference["risk_tier"])
+
+    def test_empty_frame(self, sample_df):
+        result = ShockIndexCalculator()._score_rows_python(sample_df.iloc[:0])
+        assert len(result) == 0
+        assert "risk_tier" in result.columns
+
+
+class TestCombineUfunc:
+    def test_matches_numpy_combine(self, monkeypatch):
+        pytest.importorskip("numba")
+        rng = np.random.default_rng(1)
+        factors = [rng.uniform(0, 1, 1000) for _ in range(4)]
+        calc = ShockIndexCalculator(alpha_ccs=0.4, beta_eav=0.3, gamma_cpr=0.2, delta_wm=0.1)
+        expected = calc._calculate_clipped_arrays(*factors)
+        monkeypatch.setattr(ecds_shock_index, "_NUMBA_MIN_ROWS", 0)
+        np.testing.assert_allclose(calc._calculate_clipped_arrays(*factors), expected, rtol=0, atol=1e-12)
+
+    def test_keeps_float32(self, monkeypatch):
+        pytest.importorskip("numba")
+        monkeypatch.setattr(ecds_shock_index, "_NUMBA_MIN_ROWS", 0)
+        factors = [np.full(10, 0.5, dtype=np.float32) for _ in range(4)]
+        result = ShockIndexCalculator()._calculate_clipped_arrays(*factors)
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, 0.5)
+
+    @pytest.mark.parametrize("dtype", [np.float16, np.longdouble])
+    def test_other_floats_use_numpy_path(self, monkeypatch, dtype):
+        pytest.importorskip("numba")
+        monkeypatch.setattr(ecds_shock_index, "_NUMBA_MIN_ROWS", 0)
+        factors = [np.full(10, 0.5, dtype=dtype) for _ in range(4)]
+        result = ShockIndexCalculator()._calculate_clipped_arrays(*factors)
+        assert result.dtype == dtype
+        np.testing.assert_allclose(result, 0.5)
+
+
+class TestScoreDataframeFast:
+    def test_small_frame_uses_numpy_path(self, sample_df):
+        calc = ShockIndexCalculator()
+        pd.testing.assert_frame_equal(
+            calc.score_dataframe_fast(sample_df), calc.score_dataframe(sample_df)
+        )
+
+    def test_falls_back_without_numba(self, large_df, monkeypatch):
+        monkeypatch.setattr(ecds_shock_index, "_NUMBA_MIN_ROWS", 0)
+        monkeypatch.setattr(ecds_shock_index._kernels, "score_kernel", lambda: None)
+        calc = ShockIndexCalculator()
+        pd.testing.assert_frame_equal(
+            calc.score_dataframe_fast(large_df), calc.score_dataframe(large_df)
+        )
+
+    def test_kernel_matches_numpy_path(self, large_df, monkeypatch):
+        pytest.importorskip("numba")
+        monkeypatch.setattr(ecds_shock_index, "_NUMBA_MIN_ROWS", 0)
+        calc = ShockIndexCalculator()
+        kwargs = {
+            "guardrail": 0.04,
+            "max_shift": 0.3,
+            "max_weight": 3.0,
+            "sensitivity": 0.5,
+            "baseline": 1.2,
+        }
+        fast = calc.score_dataframe_fast(large_df, **kwargs)
+        expected = calc.score_dataframe(large_df, **kwargs)
+        for col in ("ccs", "eav", "cpr", "wm", "shock_index"):
+            np.testing.assert_allclose(fast[col], expected[col], rtol=0, atol=1e-12)
+        assert list(fast["risk_tier"]) == list(expected["risk_tier"])
+
+
+class TestCalculateBatch:
+    def test_calculate_batch_matches_scalar(self):
+        rng = np.random.default_rng(3)
+        df = pd.DataFrame(rng.uniform(-0.2, 1.2, size=(200, 4)), columns=["ccs", "eav", "cpr", "wm"])
+        df.index = df.index + 100
+        calc = ShockIndexCalculator()
+        result = calc.calculate_batch(df)
+        expected = [calc.calculate(*row) for row in df.itertuples(index=False)]
+        assert result.index.equals(df.index)
+        np.testing.assert_allclose(result, expected)
+
+    def test_custom_column_names(self, sample_df):
+        calc = ShockIndexCalculator()
+        scored = calc.score_dataframe(sample_df).rename(columns={"ccs": "gap"})
+        result = calc.calculate_batch(scored, cols={"ccs": "gap"})
+        np.testing.assert_allclose(result, scored["shock_index"])
+
+    def test_missing_column_raises(self, sample_df):
+        with pytest.raises(ValueError, match="missing required columns"):
+            ShockIndexCalculator().calculate_batch(sample_df)
+
+
+class TestScoreCohort:
+    def test_matches_scalar_loop(self, sample_df):
+        cohort = pd.concat([sample_df] * 4, ignore_index=True).iloc[:10]
+        cohort.index = cohort.index * 2
+        calc = ShockIndexCalculator(alpha_ccs=0.4, beta_eav=0.2, gamma_cpr=0.2, delta_wm=0.2)
+        result = score_cohort(cohort, calc)
+
+        expected = []
+        for row in cohort.itertuples(index=False):
+            expected.append(
+                calc.calculate(
+                    ccs_score(row.completeness_rate, row.mapping_coverage),
+                    eav_score(row.variance_ratio),
+                    cpr_score(row.cutpoint_shift),
+                    wm_score(row.measure_weight),
+                )
+            )
+        assert list(result.columns) == ["shock_index", "risk_tier"]
+        assert result.index.equals(cohort.index)
+        np.testing.assert_allclose(result["shock_index"], expected)
+        assert list(result["risk_tier"]) == [classify_risk(s) for s in expected]
+
+    def test_default_calculator_matches_score_dataframe(self, large_df):
+        result = score_cohort(large_df)
+        expected = ShockIndexCalculator().score_dataframe(large_df)
+        np.testing.assert_allclose(result["shock_index"], expected["shock_index"], rtol=0, atol=1e-12)
+        assert result["risk_tier"].equals(expected["risk_tier"])
+
+    def test_param_overrides_match_score_dataframe(self, large_df):
+        kwargs = {"guardrail": 0.04, "sensitivity": 0.5, "baseline": 1.2}
+        result = score_cohort(large_df, **kwargs)
+        expected = ShockIndexCalculator().score_dataframe(large_df, **kwargs)
+        np.testing.assert_allclose(result["shock_index"], expected["shock_index"], rtol=0, atol=1e-12)
+
+    def test_uint8_quantization_error(self, large_df):
+        exact = score_cohort(large_df)
+        quantized = score_cohort(large_df, dtype=np.uint8)
+        assert quantized["shock_index"].dtype == np.uint8
+        error = np.abs(quantized["shock_index"].to_numpy() / 255.0 - exact["shock_index"].to_numpy())
+        assert error.max() <= 0.5 / 255 + 1e-12
+        assert quantized["risk_tier"].equals(exact["risk_tier"])
+
+    def test_float32(self, large_df):
+        result = score_cohort(large_df, dtype=np.float32)
+        assert result["shock_index"].dtype == np.float32
+        np.testing.assert_allclose(result["shock_index"], score_cohort(large_df)["shock_index"], atol=1e-6)
+
+    def test_rejects_other_dtypes(self, sample_df):
+        with pytest.raises(ValueError, match="dtype"):
+            score_cohort(sample_df, dtype=np.int16)
+
+
 class TestAggregateContract:
     def test_summary_keys(self, sample_df):
         calc = ShockIndexCalculator()
@@ -100,3 +393,31 @@ class TestAggregateContract:
         calc = ShockIndexCalculator()
         summary = calc.aggregate_contract(df)
         assert summary["weighted_shock_index"] == 0.0
+
+
+class TestContractAccumulator:
+    def test_chunked_updates_match_aggregate_contract(self, sample_df):
+        calc = ShockIndexCalculator()
+        scored = calc.score_dataframe(sample_df)
+        totals = ContractAccumulator()
+        for start in range(0, len(scored), 2):
+            totals.update(scored.iloc[start:start + 2])
+        assert totals.summary() == calc.aggregate_contract(scored)
+
+    def test_skips_missing_weights(self):
+        df = pd.DataFrame({"shock_index": [0.2, 0.8], "measure_weight": [1, None]})
+        summary = ContractAccumulator().update(df).summary()
+        assert summary["weighted_shock_index"] == pytest.approx(0.2)
+        assert summary["mean_shock_index"] == pytest.approx(0.5)
+        assert summary["measure_count"] == 2
+
+    def test_skips_missing_scores(self):
+        df = pd.DataFrame({"shock_index": [0.3, None, 0.9], "measure_weight": [1, 2, None]})
+        summary = ContractAccumulator().update(df).summary()
+        assert summary["weighted_shock_index"] == pytest.approx(0.1)
+        assert summary["mean_shock_index"] == pytest.approx(0.6)
+        assert summary["max_shock_index"] == pytest.approx(0.9)
+
+    def test_missing_columns_raises(self):
+        with pytest.raises(ValueError, match="missing required columns"):
+            ContractAccumulator().update(pd.DataFrame({"foo": [1]}))
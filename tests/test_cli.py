@@ -15,6 +15,21 @@ def run_cli(*args: str) -> subprocess.CompletedProcess:
     )
 
 
+class TestBuildParser:
+    def test_parser_is_reused(self):
+        cli = pytest.importorskip("cli")
+        assert cli.build_parser() is cli.build_parser()
+
+    def test_reused_parser_parses_independently(self):
+        cli = pytest.importorskip("cli")
+        first = cli.build_parser().parse_args(["single", "--ccs", "0.1", "--eav", "0.2", "--cpr", "0.3", "--wm", "0.4"])
+        second = cli.build_parser().parse_args(["--ccs", "0.9", "--eav", "0.9", "--cpr", "0.9", "--wm", "0.9"])
+        assert first.command == "single"
+        assert first.ccs == pytest.approx(0.1)
+        assert second.command is None
+        assert second.ccs == pytest.approx(0.9)
+
+
 class TestSingleMode:
     def test_legacy_flat_args(self):
         result = run_cli("--ccs", "0.86", "--eav", "0.74", "--cpr", "0.58", "--wm", "0.60")
@@ -35,6 +50,16 @@ class TestSingleMode:
         assert "shock_index" in data
         assert "risk_tier" in data
 
+    def test_single_mode_does_not_import_pandas(self):
+        code = (
+            "import sys; sys.argv = ['ecds-shock-index', 'single', '--ccs', '0.5', "
+            "'--eav', '0.5', '--cpr', '0.5', '--wm', '0.5']; "
+            "import src.cli; src.cli.main(); print('pandas' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.returncode == 0
+        assert result.stdout.strip().endswith("False")
+
     def test_no_args_shows_help(self):
         result = run_cli()
         assert result.returncode != 0
@@ -82,3 +107,46 @@ class TestBatchMode:
         json_text = "\n".join(lines[json_start:])
         data = json.loads(json_text)
         assert "weighted_shock_index" in data
+
+    def test_batch_streaming_matches_in_memory(self, tmp_path):
+        streamed = tmp_path / "streamed.csv"
+        full = tmp_path / "full.csv"
+        common = (
+            "batch",
+            "--ecds", "data/raw/example_ncqa_ecds.csv",
+            "--weights", "data/raw/example_cms_measure_weights.csv",
+        )
+        result = run_cli(*common, "--chunk-size", "2", "--output", str(streamed))
+        assert result.returncode == 0
+        assert "Contract Summary" in result.stdout
+        assert run_cli(*common, "--output", str(full)).returncode == 0
+        assert streamed.read_text() == full.read_text()
+
+    def test_invalid_chunk_size_keeps_existing_output(self, tmp_path):
+        out = tmp_path / "out.csv"
+        out.write_text("keep me\n")
+        result = run_cli(
+            "batch",
+            "--ecds", "data/raw/example_ncqa_ecds.csv",
+            "--weights", "data/raw/example_cms_measure_weights.csv",
+            "--chunk-size", "0",
+            "--output", str(out),
+        )
+        assert result.returncode == 2
+        assert "positive integer" in result.stderr
+        assert out.read_text() == "keep me\n"
+
+    def test_streaming_bad_ecds_keeps_existing_output(self, tmp_path):
+        bad = tmp_path / "bad.csv"
+        bad.write_text("a,b\n1,2\n")
+        out = tmp_path / "out.csv"
+        out.write_text("keep me\n")
+        result = run_cli(
+            "batch",
+            "--ecds", str(bad),
+            "--weights", "data/raw/example_cms_measure_weights.csv",
+            "--chunk-size", "2",
+            "--output", str(out),
+        )
+        assert result.returncode != 0
+        assert out.read_text() == "keep me\n"
@@ -1,5 +1,9 @@
 """Unit tests for ECDS Shock Index core scoring logic."""
 
+import dataclasses
+
+import numpy as np
+import pandas as pd
 import pytest
 
 from ecds_shock_index import (
@@ -8,6 +12,7 @@ from ecds_shock_index import (
     ccs_score,
     cpr_score,
     eav_score,
+    make_calculator,
     wm_score,
 )
 
@@ -20,93 +25,148 @@ from ecds_shock_index import (
 class TestCcsScore:
     """CCS is a completeness *gap*: higher = less complete = more risk."""
 
-    def test_gap_from_average(self):
-        assert ccs_score(0.8, 0.9) == pytest.approx(0.15)
-
-    def test_perfect_capture_is_zero_risk(self):
-        assert ccs_score(1.0, 1.0) == pytest.approx(0.0)
-
-    def test_no_capture_is_max_risk(self):
-        assert ccs_score(0.0, 0.0) == pytest.approx(1.0)
-
-    def test_clips_above_one(self):
-        # Negative inputs would push the gap above 1.0; clamp at 1.0.
-        assert ccs_score(-0.5, 0.0) == pytest.approx(1.0)
-
-    def test_clips_below_zero(self):
-        # Over-complete inputs would push the gap below 0.0; clamp at 0.0.
-        assert ccs_score(1.2, 1.0) == pytest.approx(0.0)
+    @pytest.mark.parametrize(
+        ("completeness", "coverage", "expected"),
+        [
+            pytest.param(0.8, 0.9, 0.15, id="gap_from_average"),
+            pytest.param(1.0, 1.0, 0.0, id="perfect_capture_is_zero_risk"),
+            pytest.param(0.0, 0.0, 1.0, id="no_capture_is_max_risk"),
+            # Negative inputs would push the gap above 1.0; clamp at 1.0.
+            pytest.param(-0.5, 0.0, 1.0, id="clips_above_one"),
+            # Over-complete inputs would push the gap below 0.0; clamp at 0.0.
+            pytest.param(1.2, 1.0, 0.0, id="clips_below_zero"),
+        ],
+    )
+    def test_ccs_score(self, completeness, coverage, expected):
+        assert ccs_score(completeness, coverage) == pytest.approx(expected)
 
 
 class TestEavScore:
-    def test_baseline_is_zero_risk(self):
-        assert eav_score(1.0, baseline=1.0) == pytest.approx(0.0)
-
-    def test_above_baseline(self):
-        assert eav_score(1.5, baseline=1.0) == pytest.approx(0.5)
-
-    def test_below_baseline_is_symmetric(self):
-        assert eav_score(0.5, baseline=1.0) == pytest.approx(0.5)
-
-    def test_clips_high_ratio(self):
-        assert eav_score(3.0, baseline=1.0) == pytest.approx(1.0)
-
-    def test_sensitivity_scales_deviation(self):
-        assert eav_score(1.5, baseline=1.0, sensitivity=2.0) == pytest.approx(0.25)
-
-    def test_invalid_baseline(self):
-        with pytest.raises(ValueError, match="baseline"):
-            eav_score(1.0, baseline=0)
-        with pytest.raises(ValueError, match="baseline"):
-            eav_score(1.0, baseline=-1)
-
-    def test_invalid_sensitivity(self):
-        with pytest.raises(ValueError, match="sensitivity"):
-            eav_score(1.0, sensitivity=0)
+    @pytest.mark.parametrize(
+        ("ratio", "kwargs", "expected"),
+        [
+            pytest.param(1.0, {"baseline": 1.0}, 0.0, id="baseline_is_zero_risk"),
+            pytest.param(1.5, {"baseline": 1.0}, 0.5, id="above_baseline"),
+            pytest.param(0.5, {"baseline": 1.0}, 0.5, id="below_baseline_is_symmetric"),
+            pytest.param(3.0, {"baseline": 1.0}, 1.0, id="clips_high_ratio"),
+            pytest.param(1.5, {"baseline": 1.0, "sensitivity": 2.0}, 0.25, id="sensitivity_scales_deviation"),
+        ],
+    )
+    def test_eav_score(self, ratio, kwargs, expected):
+        assert eav_score(ratio, **kwargs) == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"baseline": 0}, "baseline"),
+            ({"baseline": -1}, "baseline"),
+            ({"sensitivity": 0}, "sensitivity"),
+        ],
+    )
+    def test_invalid_parameters(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            eav_score(1.0, **kwargs)
 
 
 class TestCprScore:
-    def test_within_guardrail_scales_realized(self):
-        # Half the guardrail consumed, no latent term -> 0.8 * 0.5.
-        assert cpr_score(0.025, guardrail=0.05) == pytest.approx(0.4)
-
-    def test_at_guardrail_is_full_realized(self):
-        assert cpr_score(0.05, guardrail=0.05) == pytest.approx(0.8)
-
-    def test_beyond_guardrail_adds_latent(self):
-        # realized=1.0, latent=(0.55-0.05)/0.5=1.0 -> 0.8 + 0.2.
-        assert cpr_score(0.55, guardrail=0.05, max_shift=0.5) == pytest.approx(1.0)
-
-    def test_negative_shift_uses_absolute(self):
-        assert cpr_score(-0.025, guardrail=0.05) == pytest.approx(0.4)
-
-    def test_zero_shift(self):
-        assert cpr_score(0.0) == pytest.approx(0.0)
-
-    def test_invalid_guardrail(self):
-        with pytest.raises(ValueError, match="guardrail"):
-            cpr_score(0.2, guardrail=0)
-
-    def test_invalid_max_shift(self):
-        with pytest.raises(ValueError, match="max_shift"):
-            cpr_score(0.2, max_shift=0)
+    @pytest.mark.parametrize(
+        ("shift", "kwargs", "expected"),
+        [
+            # Half the guardrail consumed, no latent term -> 0.8 * 0.5.
+            pytest.param(0.025, {"guardrail": 0.05}, 0.4, id="within_guardrail_scales_realized"),
+            pytest.param(0.05, {"guardrail": 0.05}, 0.8, id="at_guardrail_is_full_realized"),
+            # realized=1.0, latent=(0.55-0.05)/0.5=1.0 -> 0.8 + 0.2.
+            pytest.param(0.55, {"guardrail": 0.05, "max_shift": 0.5}, 1.0, id="beyond_guardrail_adds_latent"),
+            pytest.param(-0.025, {"guardrail": 0.05}, 0.4, id="negative_shift_uses_absolute"),
+            pytest.param(0.0, {}, 0.0, id="zero_shift"),
+        ],
+    )
+    def test_cpr_score(self, shift, kwargs, expected):
+        assert cpr_score(shift, **kwargs) == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"guardrail": 0}, "guardrail"),
+            ({"max_shift": 0}, "max_shift"),
+        ],
+    )
+    def test_invalid_parameters(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            cpr_score(0.2, **kwargs)
 
 
 class TestWmScore:
-    def test_normalization(self):
-        assert wm_score(3, max_weight=5) == pytest.approx(0.6)
-
-    def test_max_weight(self):
-        assert wm_score(5, max_weight=5) == pytest.approx(1.0)
-
-    def test_zero_weight(self):
-        assert wm_score(0, max_weight=5) == pytest.approx(0.0)
+    @pytest.mark.parametrize(
+        ("weight", "expected"),
+        [
+            pytest.param(3, 0.6, id="normalization"),
+            pytest.param(5, 1.0, id="max_weight"),
+            pytest.param(0, 0.0, id="zero_weight"),
+        ],
+    )
+    def test_wm_score(self, weight, expected):
+        assert wm_score(weight, max_weight=5) == pytest.approx(expected)
 
     def test_invalid_max_weight(self):
         with pytest.raises(ValueError, match="max_weight"):
             wm_score(1, max_weight=0)
 
 
+class TestArrayInputs:
+    values = [-0.5, 0.0, 0.02, 0.05, 0.3, 1.0, 1.7, 2.5]
+
+    def test_ccs_matches_scalar(self):
+        other = self.values[::-1]
+        result = ccs_score(np.array(self.values), pd.Series(other))
+        expected = [ccs_score(a, b) for a, b in zip(self.values, other)]
+        np.testing.assert_allclose(result, expected)
+
+    def test_eav_matches_scalar(self):
+        result = eav_score(np.array(self.values), baseline=0.8, sensitivity=0.5)
+        expected = [eav_score(v, baseline=0.8, sensitivity=0.5) for v in self.values]
+        np.testing.assert_allclose(result, expected)
+
+    def test_cpr_matches_scalar(self):
+        result = cpr_score(np.array(self.values), guardrail=0.05, max_shift=0.5)
+        expected = [cpr_score(v, guardrail=0.05, max_shift=0.5) for v in self.values]
+        np.testing.assert_allclose(result, expected)
+
+    def test_wm_matches_scalar(self):
+        result = wm_score([0, 1, 2, 3, 5, 7], max_weight=5)
+        expected = [wm_score(v, max_weight=5) for v in [0, 1, 2, 3, 5, 7]]
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_allclose(result, expected)
+
+    def test_njit_kernels_match_python(self):
+        pytest.importorskip("numba")
+        from ecds_shock_index import _numba_kernels as nk
+
+        for v in self.values + [float("nan")]:
+            assert nk._ccs_kernel(v, 0.4) == pytest.approx(ccs_score(v, 0.4), nan_ok=True)
+            assert nk._eav_kernel(v, 1 / 0.8, 1 / 0.5) == pytest.approx(
+                eav_score(v, baseline=0.8, sensitivity=0.5), nan_ok=True
+            )
+            assert nk._cpr_kernel(v, 0.05, 1 / 0.05, 1 / 0.5, 0.2) == pytest.approx(
+                cpr_score(v, guardrail=0.05, max_shift=0.5), nan_ok=True
+            )
+            assert nk._wm_kernel(v, 1 / 5) == pytest.approx(wm_score(v, max_weight=5), nan_ok=True)
+
+    def test_numpy_scalars_take_scalar_path(self):
+        assert wm_score(np.int64(3)) == wm_score(3) == 0.6
+        assert cpr_score(np.float64(0.025)) == cpr_score(0.025)
+        assert not isinstance(eav_score(np.float32(1.5)), np.ndarray)
+        assert classify_risk(np.float32(0.3)) == "moderate"
+        calc = ShockIndexCalculator()
+        result = calc.calculate(np.float32(0.5), 0.5, 0.5, 0.5)
+        assert not isinstance(result, np.ndarray)
+        assert result == pytest.approx(0.5)
+
+    def test_invalid_parameters_raise_for_arrays(self):
+        with pytest.raises(ValueError, match="guardrail"):
+            cpr_score(np.array(self.values), guardrail=0)
+
+
 # ---------------------------------------------------------------------------
 # Risk classification
 # ---------------------------------------------------------------------------
@@ -133,6 +193,15 @@ class TestClassifyRisk:
         assert classify_risk(-0.5) == "low"
         assert classify_risk(1.5) == "critical"
 
+    def test_nan_is_critical(self):
+        assert classify_risk(float("nan")) == "critical"
+
+    def test_classify_risk_array(self):
+        scores = [-0.5, 0.0, 0.24, 0.25, 0.49, 0.5, 0.74, 0.75, 1.0, 1.5, float("nan")]
+        labels = classify_risk(np.array(scores))
+        assert isinstance(labels, np.ndarray)
+        assert labels.tolist() == [classify_risk(s) for s in scores]
+
 
 # ---------------------------------------------------------------------------
 # Calculator
@@ -158,6 +227,58 @@ class TestShockIndexCalculator:
         calc = ShockIndexCalculator()
         assert calc.calculate(1, 1, 1, 1) == pytest.approx(1.0)
 
+    def test_calculate_arrays_match_scalar(self):
+        calc = ShockIndexCalculator(alpha_ccs=0.4, beta_eav=0.2, gamma_cpr=0.2, delta_wm=0.2)
+        rows = [(0.8, 0.5, 0.5, 0.5), (0.0, 0.0, 0.0, 0.0), (1.5, -0.2, 1.0, 0.3), (1.0, 1.0, 1.0, 1.0)]
+        result = calc.calculate(*(np.array(col) for col in zip(*rows)))
+        assert isinstance(result, np.ndarray)
+        np.testing.assert_allclose(result, [calc.calculate(*row) for row in rows])
+
+        # 2-D factors of shape (4, k) must combine elementwise, not contract.
+        grid = np.random.default_rng(0).uniform(-0.2, 1.2, size=(4, 4, 2))
+        expected = [[calc.calculate(*grid[:, i, j]) for j in range(2)] for i in range(4)]
+        np.testing.assert_allclose(calc.calculate(*grid), expected)
+
+    def test_array_path_honors_reassigned_weights(self):
+        calc = ShockIndexCalculator()
+        calc.alpha_ccs, calc.delta_wm = 0.15, 0.40
+        assert calc.calculate(1, 0, 0, 0) == pytest.approx(0.15)
+        np.testing.assert_allclose(calc.calculate(np.ones(3), np.zeros(3), np.zeros(3), np.zeros(3)), 0.15)
+
+    def test_calculate_clamps_inputs(self):
+        calc = ShockIndexCalculator(alpha_ccs=0.4, beta_eav=0.2, gamma_cpr=0.2, delta_wm=0.2)
+        assert calc.calculate(1.5, -0.5, 0.5, 0.5) == pytest.approx(0.6)
+        # NaN factors clamp to 1.0, as in _clip_01.
+        assert calc.calculate(float("nan"), 0, 0, 0) == pytest.approx(0.4)
+
+    def test_combine_clipped_matches_calculate_for_in_range_factors(self):
+        calc = ShockIndexCalculator(alpha_ccs=0.4, beta_eav=0.2, gamma_cpr=0.2, delta_wm=0.2)
+        assert calc._combine_clipped(0.8, 0.5, 0.5, 0.5) == pytest.approx(
+            calc.calculate(ccs=0.8, eav=0.5, cpr=0.5, wm=0.5)
+        )
+
+    def test_make_calculator_cached(self):
+        calc = make_calculator(0.25, 0.25, 0.25, 0.25)
+        assert calc is make_calculator(0.25, 0.25, 0.25, 0.25)
+        assert isinstance(calc, ShockIndexCalculator)
+        assert dataclasses.astuple(calc) == dataclasses.astuple(ShockIndexCalculator(0.25, 0.25, 0.25, 0.25))
+        assert calc == ShockIndexCalculator(0.25, 0.25, 0.25, 0.25)
+        assert ShockIndexCalculator(0.25, 0.25, 0.25, 0.25) == calc
+        assert calc != ShockIndexCalculator(0.4, 0.2, 0.2, 0.2)
+        assert repr(calc) == repr(ShockIndexCalculator(0.25, 0.25, 0.25, 0.25))
+
+    def test_make_calculator_is_immutable(self):
+        calc = make_calculator()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            calc.alpha_ccs = 0.5
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            calc.guardrail = 0.1
+        assert make_calculator().alpha_ccs == 0.35
+
+    def test_make_calculator_validates(self):
+        with pytest.raises(ValueError, match="sum to 1.0"):
+            make_calculator(0.5, 0.5, 0.5, 0.5)
+
     def test_invalid_weights_not_summing_to_one(self):
         with pytest.raises(ValueError, match="sum to 1.0"):
             ShockIndexCalculator(alpha_ccs=0.5, beta_eav=0.5, gamma_cpr=0.5, delta_wm=0.5)
@@ -166,6 +287,11 @@ class TestShockIndexCalculator:
         with pytest.raises(ValueError, match="non-negative"):
             ShockIndexCalculator(alpha_ccs=-0.1, beta_eav=0.5, gamma_cpr=0.3, delta_wm=0.3)
 
+    @pytest.mark.parametrize("name", ["baseline", "guardrail", "max_shift", "max_weight", "sensitivity"])
+    def test_invalid_factor_parameters_rejected(self, name):
+        with pytest.raises(ValueError, match=f"{name} must be greater than zero"):
+            ShockIndexCalculator(**{name: 0})
+
     def test_invalid_parameters_raise_errors(self):
         with pytest.raises(ValueError):
             eav_score(variance_ratio=1.1, baseline=0)
@@ -4,7 +4,9 @@ import pytest
 
 import pandas as pd
 
+from ecds_shock_index import data_loader
 from ecds_shock_index.data_loader import (
+    iter_ncqa_ecds,
     load_cms_measure_weights,
     load_ncqa_ecds,
     merge_ecds_and_weights,
@@ -13,6 +15,11 @@ from ecds_shock_index.data_loader import (
 DATA_DIR = "data/raw"
 
 
+@pytest.fixture(autouse=True)
+def clear_weights_cache():
+    data_loader._load_cms_cached.cache_clear()
+
+
 class TestLoadNcqaEcds:
     def test_loads_example_file(self):
         df = load_ncqa_ecds(f"{DATA_DIR}/example_ncqa_ecds.csv")
@@ -25,6 +32,41 @@ class TestLoadNcqaEcds:
         with pytest.raises(ValueError, match="missing required columns"):
             load_ncqa_ecds(bad)
 
+    def test_skips_unneeded_columns(self, tmp_path):
+        path = tmp_path / "wide.csv"
+        path.write_text(
+            "measure_id,notes,completeness_rate,mapping_coverage,variance_ratio,cutpoint_shift\n"
+            "COL,free text,1,0.9,1.0,0.02\n"
+        )
+        df = load_ncqa_ecds(path)
+        assert "notes" not in df.columns
+        assert pd.api.types.is_float_dtype(df["completeness_rate"])
+
+    def test_loads_without_pyarrow(self, monkeypatch):
+        monkeypatch.setattr(data_loader, "_HAS_PYARROW", False)
+        df = load_ncqa_ecds(f"{DATA_DIR}/example_ncqa_ecds.csv")
+        assert len(df) == 3
+        assert df["completeness_rate"].dtype == "float64"
+
+    def test_load_ncqa_ecds_dtype(self, monkeypatch):
+        pytest.importorskip("pyarrow")
+        engines = []
+        read_csv = pd.read_csv
+
+        def spy(*args, **kwargs):
+            engines.append(kwargs.get("engine"))
+            return read_csv(*args, **kwargs)
+
+        monkeypatch.setattr(data_loader.pd, "read_csv", spy)
+        df = load_ncqa_ecds(f"{DATA_DIR}/example_ncqa_ecds.csv")
+        assert engines[-1] == "pyarrow"
+        assert pd.api.types.is_string_dtype(df["measure_id"].cat.categories)
+        assert (df.drop(columns="measure_id").dtypes == "float64").all()
+
+    def test_measure_id_is_categorical(self):
+        df = load_ncqa_ecds(f"{DATA_DIR}/example_ncqa_ecds.csv")
+        assert isinstance(df["measure_id"].dtype, pd.CategoricalDtype)
+
 
 class TestLoadCmsMeasureWeights:
     def test_loads_example_file(self):
@@ -38,6 +80,118 @@ class TestLoadCmsMeasureWeights:
         with pytest.raises(ValueError, match="missing required columns"):
             load_cms_measure_weights(bad)
 
+    def test_keeps_measure_name(self):
+        df = load_cms_measure_weights(f"{DATA_DIR}/example_cms_measure_weights.csv")
+        assert "measure_name" in df.columns
+        assert pd.api.types.is_float_dtype(df["measure_weight"])
+
+    def test_load_cms_is_cached(self, monkeypatch):
+        calls = []
+        read_csv = pd.read_csv
+
+        def spy(*args, **kwargs):
+            calls.append(args)
+            return read_csv(*args, **kwargs)
+
+        monkeypatch.setattr(data_loader.pd, "read_csv", spy)
+        first = load_cms_measure_weights(f"{DATA_DIR}/example_cms_measure_weights.csv")
+        count = len(calls)
+        assert count > 0
+        first["measure_weight"] = 0.0
+        second = load_cms_measure_weights(f"{DATA_DIR}/example_cms_measure_weights.csv")
+        assert len(calls) == count
+        assert (second["measure_weight"] > 0).all()
+
+
+class TestParquetInput:
+    def test_reads_parquet_file(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        source = pd.read_csv(f"{DATA_DIR}/example_ncqa_ecds.csv")
+        source["notes"] = "x"
+        path = tmp_path / "ecds.parquet"
+        source.to_parquet(path, index=False)
+        df = load_ncqa_ecds(path)
+        assert len(df) == 3
+        assert "notes" not in df.columns
+
+    def test_parquet_missing_columns_raises(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "bad.parquet"
+        pd.DataFrame({"x": [1]}).to_parquet(path, index=False)
+        with pytest.raises(ValueError, match="missing required columns"):
+            load_cms_measure_weights(path)
+
+
+class TestParquetCache:
+    def test_cache_written_and_reused(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        cache = tmp_path / "cache"
+        first = load_ncqa_ecds(f"{DATA_DIR}/example_ncqa_ecds.csv", cache_dir=cache)
+        assert len(list(cache.glob("*.parquet"))) == 1
+        second = load_ncqa_ecds(f"{DATA_DIR}/example_ncqa_ecds.csv", cache_dir=cache)
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_changed_file_replaces_cache_entry(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        cache = tmp_path / "cache"
+        path = tmp_path / "weights.csv"
+        path.write_text("measure_id,measure_weight\nCOL,1\n")
+        load_cms_measure_weights(path, cache_dir=cache)
+        path.write_text("measure_id,measure_weight\nCOL,1\nBCS,3\n")
+        df = load_cms_measure_weights(path, cache_dir=cache)
+        assert len(df) == 2
+        assert len(list(cache.glob("*.parquet"))) == 1
+
+    def test_stale_entry_removed_for_glob_like_name(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        cache = tmp_path / "cache"
+        path = tmp_path / "w[1].csv"
+        path.write_text("measure_id,measure_weight\nCOL,1\n")
+        load_cms_measure_weights(path, cache_dir=cache)
+        path.write_text("measure_id,measure_weight\nCOL,1\nBCS,3\n")
+        load_cms_measure_weights(path, cache_dir=cache)
+        assert len(list(cache.glob("*.parquet"))) == 1
+
+    def test_truncated_cache_entry_is_replaced(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        cache = tmp_path / "cache"
+        source = f"{DATA_DIR}/example_ncqa_ecds.csv"
+        first = load_ncqa_ecds(source, cache_dir=cache)
+        (entry,) = cache.glob("*.parquet")
+        entry.write_bytes(entry.read_bytes()[:20])
+        pd.testing.assert_frame_equal(load_ncqa_ecds(source, cache_dir=cache), first)
+        pd.testing.assert_frame_equal(pd.read_parquet(entry).astype({"measure_id": "category"}), first)
+        assert list(cache.iterdir()) == [entry]
+
+
+class TestIterNcqaEcds:
+    def test_chunks_cover_file(self):
+        chunks = list(iter_ncqa_ecds(f"{DATA_DIR}/example_ncqa_ecds.csv", chunk_size=2))
+        assert [len(c) for c in chunks] == [2, 1]
+        full = load_ncqa_ecds(f"{DATA_DIR}/example_ncqa_ecds.csv")
+        # Each chunk carries its own categories, so compare ids as strings.
+        as_str = {"measure_id": "string"}
+        pd.testing.assert_frame_equal(
+            pd.concat(chunks, ignore_index=True).astype(as_str), full.astype(as_str)
+        )
+
+    def test_parquet_chunks(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "ecds.parquet"
+        pd.read_csv(f"{DATA_DIR}/example_ncqa_ecds.csv").to_parquet(path, index=False)
+        chunks = list(iter_ncqa_ecds(path, chunk_size=2))
+        assert [len(c) for c in chunks] == [2, 1]
+
+    def test_rejects_bad_columns(self, tmp_path):
+        bad = tmp_path / "bad.csv"
+        bad.write_text("a,b\n1,2\n")
+        with pytest.raises(ValueError, match="missing required columns"):
+            next(iter_ncqa_ecds(bad, chunk_size=10))
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError, match="chunk_size"):
+            next(iter_ncqa_ecds(f"{DATA_DIR}/example_ncqa_ecds.csv", chunk_size=0))
+
 
 class TestMergeEcdsAndWeights:
     def test_merge_on_measure_id(self):
@@ -53,3 +207,62 @@ class TestMergeEcdsAndWeights:
         merged = merge_ecds_and_weights(ecds, weights)
         assert len(merged) == 3
         assert pd.isna(merged.loc[merged["measure_id"] == "C", "measure_weight"].iloc[0])
+
+    def test_accepts_precomputed_mapping(self):
+        ecds = pd.DataFrame({"measure_id": ["A", "B"], "val": [1, 2]})
+        merged = merge_ecds_and_weights(ecds, {"A": 3, "B": 5})
+        assert list(merged["measure_weight"]) == [3, 5]
+
+    def test_merge_preserves_dtype(self):
+        weights = pd.DataFrame({"measure_id": ["A", "B"], "measure_weight": [3, 5]})
+        plain = pd.DataFrame({"measure_id": ["A", "C"], "val": [1, 2]})
+        categorical = plain.astype({"measure_id": "category"})
+        for ecds in (plain, categorical):
+            merged = merge_ecds_and_weights(ecds, weights)
+            assert pd.api.types.is_numeric_dtype(merged["measure_weight"])
+            assert merged["measure_weight"].iloc[0] == 3
+
+    def test_extra_weight_columns_are_carried_through(self):
+        ecds = pd.DataFrame({"measure_id": ["A", "B"], "val": [1, 2]})
+        weights = pd.DataFrame(
+            {"measure_id": ["B", "A"], "measure_name": ["Bee", "Ay"], "measure_weight": [5, 3]}
+        )
+        merged = merge_ecds_and_weights(ecds, weights)
+        assert list(merged["measure_name"]) == ["Ay", "Bee"]
+        assert list(merged["measure_weight"]) == [3, 5]
+
+    def test_categorical_ids_map_by_code(self):
+        ecds = pd.DataFrame({"measure_id": pd.Categorical(["A", None, "C", "A"]), "val": [1, 2, 3, 4]})
+        merged = merge_ecds_and_weights(ecds, {"A": 3.0, "B": 5.0})
+        assert merged["measure_weight"].tolist()[::3] == [3.0, 3.0]
+        assert merged["measure_weight"].iloc[1:3].isna().all()
+
+    def test_categorical_merge_unifies_categories(self):
+        ecds = pd.DataFrame({"measure_id": pd.Categorical(["A", "B", "C"]), "val": [1, 2, 3]})
+        weights = pd.DataFrame(
+            {
+                "measure_id": pd.Categorical(["B", "A", "D"]),
+                "measure_name": ["Bee", "Ay", "Dee"],
+                "measure_weight": [5.0, 3.0, 1.0],
+            }
+        )
+        merged = merge_ecds_and_weights(ecds, weights)
+        assert isinstance(merged["measure_id"].dtype, pd.CategoricalDtype)
+        assert list(merged["measure_id"]) == ["A", "B", "C"]
+        assert list(merged["measure_name"].iloc[:2]) == ["Ay", "Bee"]
+        assert pd.isna(merged["measure_weight"].iloc[2])
+
+    def test_large_categorical_merge_stays_categorical(self):
+        ids = [f"M{i:03d}" for i in range(200)]
+        ecds = pd.DataFrame({"measure_id": pd.Categorical(ids * 50), "val": range(10_000)})
+        weights = pd.DataFrame(
+            {
+                "measure_id": pd.Categorical(ids[::-1]),
+                "measure_name": ids[::-1],
+                "measure_weight": [float(i % 5 + 1) for i in range(200)][::-1],
+            }
+        )
+        merged = merge_ecds_and_weights(ecds, weights)
+        assert len(merged) == 10_000
+        assert merged["measure_id"].dtype.name == "category"
+        assert (merged["measure_name"] == merged["measure_id"].astype(str)).all()